@@ -0,0 +1,80 @@
+"""Copyright (C) 2021-2025 Katelynn Cadwallader.
+
+This file is part of Moogle's Intuition.
+
+Moogle's Intuition is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 3, or (at your option)
+any later version.
+
+Moogle's Intuition is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public
+License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Moogle's Intuition; see the file COPYING.  If not, write to the Free
+Software Foundation, 51 Franklin Street - Fifth Floor, Boston, MA
+02110-1301, USA.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Optional
+
+import aiohttp
+
+__all__ = ("local_session", "slot_names")
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+def local_session(session: Optional[aiohttp.ClientSession]) -> aiohttp.ClientSession:
+    """Returns the provided `session` if it is still open, otherwise creates a new `<aiohttp.ClientSession>`.
+
+    .. note::
+        Used by `<Builder._get_session()>` and `<Angler._get_session()>` for the session they create themselves,
+        so it is reused for every request and only replaced if it has never been created or was closed.
+
+
+    Parameters
+    ----------
+    session: :class:`Optional[aiohttp.ClientSession]`
+        The previously created `<aiohttp.ClientSession>`, if any.
+
+    Returns
+    -------
+    :class:`aiohttp.ClientSession`
+        An open `<aiohttp.ClientSession>`.
+
+    """
+    if session is not None and session.closed is False:
+        return session
+    # Every request goes to the same host, so we cache its DNS lookup and cap how many sockets we open to it.
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=10, ttl_dns_cache=300))
+    LOGGER.debug("<%s> | Creating local `aiohttp.ClientSession()` | session: %s", "local_session", session)
+    return session
+
+
+@functools.cache
+def slot_names(cls: type) -> frozenset[str]:
+    """Every `__slots__` entry defined along the MRO of `cls`.
+
+    .. note::
+        The slots of a class never change, so the MRO is only walked once per class.
+
+
+    Parameters
+    ----------
+    cls: :class:`type`
+        The class to collect the slots of.
+
+    Returns
+    -------
+    :class:`frozenset[str]`
+        The slot names, including any private `_` slots.
+
+    """
+    return frozenset(key for base in cls.__mro__ for key in getattr(base, "__slots__", ()))
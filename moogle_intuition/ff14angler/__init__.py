@@ -20,16 +20,21 @@ Software Foundation, 51 Franklin Street - Fifth Floor, Boston, MA
 
 from __future__ import annotations
 
+import copy
+import itertools
 import logging
-from typing import TYPE_CHECKING, Any, Literal, Optional, overload
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, overload
 
-import aiohttp
 import bs4
 from bs4.element import AttributeValueList, NavigableString
+from bs4.filter import SoupStrainer
+
+from moogle_intuition._utils import local_session, slot_names
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
+    import aiohttp
     from bs4._typing import (
         _AtMostOneElement as bs4AtMostOneElement,  # pyright: ignore[reportPrivateUsage]
         _AttributeValue as bs4AttributeValue,  # pyright: ignore[reportPrivateUsage]
@@ -44,9 +49,29 @@ __all__ = ("Angler", "AnglerBaits", "AnglerFish")
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Every FF14 Angler url is built from one of these prefixes, so we only assemble them once.
+# - `<moogle_intuition.modules>` imports them for the `angler_url` properties, so they are not underscore private.
+ANGLER_BASE_URL: str = "https://en.ff14angler.com/"
+ANGLER_SPOT_URL: str = ANGLER_BASE_URL + "spot/"
+ANGLER_FISH_URL: str = ANGLER_BASE_URL + "fish/"
+
+# Matchers for the `.find()` calls made on every fish/bait row, otherwise bs4 builds a new `SoupStrainer` per call.
+_ANCHOR_STRAINER: SoupStrainer = SoupStrainer("a")
+_CANVAS_STRAINER: SoupStrainer = SoupStrainer("canvas")
+_STRONG_STRAINER: SoupStrainer = SoupStrainer(class_="strong")
+_TUG_SEC_STRAINER: SoupStrainer = SoupStrainer(class_="tug_sec")
+
+# The most `<Angler._location_cache>` and `<Angler._fish_cache>` entries we hold onto, the oldest entry is dropped first.
+_LOCATION_CACHE_SIZE: int = 256
+_FISH_CACHE_SIZE: int = 1024
+
 
 class PartialAngler:
-    _repr_keys: list[str]
+    # Controls the amount of information we return via `__str__()` and `__repr__()` dunder methods.
+    # - If `None`, every attribute is shown.
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = None
+
+    __slots__ = ()
 
     def __init__(self) -> None:
         LOGGER.debug("<%s.__init__()>", __class__.__name__)
@@ -55,14 +80,13 @@ class PartialAngler:
         return self.__repr__()
 
     def __repr__(self) -> str:
-        try:
-            return f"\n\n__{self.__class__.__name__}__\n" + "\n".join([
-                f"{e}: {getattr(self, e)}" for e in self._repr_keys if e.startswith("_") is False
-            ])
-        except AttributeError:
-            return f"\n\n__{self.__class__.__name__}__\n" + "\n".join([
-                f"{e}: {getattr(self, e)}" for e in sorted(self.__dict__) if e.startswith("_") is False
-            ])
+        keys: Optional[Iterable[str]] = self._repr_keys
+        if keys is None:
+            # Subclasses may be slotted, so we collect the slots defined along the MRO along with any `__dict__` entries.
+            keys = sorted(slot_names(type(self)).union(getattr(self, "__dict__", ())))
+        return f"\n\n__{self.__class__.__name__}__\n" + "\n".join(
+            f"{e}: {getattr(self, e, None)}" for e in keys if e.startswith("_") is False
+        )
 
 
 class Angler(PartialAngler):
@@ -80,6 +104,12 @@ class Angler(PartialAngler):
     session: Optional[aiohttp.ClientSession]
     _session: Optional[aiohttp.ClientSession]
 
+    # Fishing spot pages rarely change, so we keep any parsed results around for the lifetime of the object.
+    # Every fish of a fully parsed spot page. `location_id : {fish_id : FishingData}`
+    _location_cache: dict[int, dict[int, FishingData]]
+    # A single fish picked out of a spot page, parsing stops early once the fish is found. `(location_id, fish_id) : FishingData`
+    _fish_cache: dict[tuple[int, int], FishingData]
+
     def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
         """Build our :class:`Angler` object.
 
@@ -91,6 +121,13 @@ class Angler(PartialAngler):
         """
         self.session = session
         self._session = None
+        self._location_cache = {}
+        self._fish_cache = {}
+
+    def clear_cache(self) -> None:
+        """Clears any cached FF14 Angler location data."""
+        self._location_cache.clear()
+        self._fish_cache.clear()
 
     async def clean_up(self) -> None:
         """Cleans up any open resources."""
@@ -98,31 +135,29 @@ class Angler(PartialAngler):
         if self._session is not None:
             await self._session.close()
 
-    async def _request(self, url: str) -> Optional[bytes]:
-        if self.session is None:
-            if self._session is None:
-                session: aiohttp.ClientSession = aiohttp.ClientSession()
-                self._session = session
-                LOGGER.debug("<%s._request> | Creating local `aiohttp.ClientSession()` | session: %s", __class__.__name__, session)
-            else:
-                session = self._session
-        else:
-            session = self.session
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is not None:
+            return self.session
+        self._session = local_session(self._session)
+        return self._session
 
-        res: aiohttp.ClientResponse = await session.get(url=url)
-        if res.status != 200:
-            LOGGER.error("<%s._request> failed to access the url. | Status Code: %s | URL: %s", __class__.__name__, res.status, url)
-            return None
-            # raise ConnectionError("Unable to access the url: %s", url)
-        if res.content_type == "application/json":
-            LOGGER.error(
-                "<%s._request> is of the wrong content_type. | Content Type: %s | URL: %s",
-                __class__.__name__,
-                res.content_type,
-                url,
-            )
-            return None
-        return await res.content.read()
+    async def _request(self, url: str) -> Optional[bytes]:
+        session: aiohttp.ClientSession = self._get_session()
+        # Exiting the response context hands the connection back to the session's pool.
+        async with session.get(url=url) as res:
+            if res.status != 200:
+                LOGGER.error("<%s._request> failed to access the url. | Status Code: %s | URL: %s", __class__.__name__, res.status, url)
+                return None
+                # raise ConnectionError("Unable to access the url: %s", url)
+            if res.content_type == "application/json":
+                LOGGER.error(
+                    "<%s._request> is of the wrong content_type. | Content Type: %s | URL: %s",
+                    __class__.__name__,
+                    res.content_type,
+                    url,
+                )
+                return None
+            return await res.content.read()
 
     @overload
     async def get_location_fish_data(self, location_id: int, fish_id: int = ...) -> Optional[FishingData]: ...
@@ -158,15 +193,26 @@ class Angler(PartialAngler):
 
         """
         LOGGER.debug("Fetching FF14Angler location data for Location ID: %s | Fish ID: %s ", location_id, fish_id)
-
-        url: str = "https://en.ff14angler.com/spot/" + str(location_id)
+        # The cached data is copied on the way out, so callers can't change what we hand to the next caller.
+        if fish_id is not None:
+            cached_fish: Optional[FishingData] = self._fish_cache.get((location_id, fish_id))
+            if cached_fish is not None:
+                return copy.deepcopy(cached_fish)
+        # We may have already parsed the entire location, which includes our fish.
+        cached_location: Optional[dict[int, FishingData]] = self._location_cache.get(location_id)
+        if cached_location is not None:
+            if fish_id is not None and fish_id in cached_location:
+                return copy.deepcopy(cached_location[fish_id])
+            return copy.deepcopy(cached_location)
+
+        url: str = ANGLER_SPOT_URL + str(location_id)
 
         fishing_html_data: Optional[bytes] = await self._request(url=url)
         if fishing_html_data is None:
             LOGGER.error("<%s.get_location_id_mapping> failed to get data from url: %s", __class__.__name__, url)
             return None
 
-        soup = AnglerSoup(fishing_html_data, "html.parser")
+        soup = AnglerSoup(fishing_html_data)
         # ID is the ff14 angler fishing ID, each entry is a dictionary containing
         #    name, TackleID->percent, Restrictions
         fishing_data: dict[int, FishingData] = {}
@@ -177,7 +223,7 @@ class Angler(PartialAngler):
             LOGGER.error("<%s.get_fish_data> failed to find `class_='info_section list'`.", __class__.__name__)
             return None
 
-        info_sec_children: list[CustomTag] = list(info_section.children)
+        info_sec_children: list[CustomTag] = info_section.contents
 
         try:
             # Attempt to index to the fish data, this could fail.
@@ -185,16 +231,16 @@ class Angler(PartialAngler):
         except IndexError:
             LOGGER.exception("<%s.get_fish_data> had an <IndexError> for `poss_fish`.", __class__.__name__)
             return None
-        avail_fish: list[CustomTag] = list(poss_fish.children)
+        avail_fish: list[CustomTag] = poss_fish.contents
 
         flag = False
         cur_fish_tug = "UNK"
         cur_fish_double = 0
-        for fish_index in range(1, len(avail_fish), 2):
+        cur_fish_page: CustomTag
+        for cur_fish_page in avail_fish[1::2]:
             if flag is True and fish_id is not None:
                 break
-            cur_fish_page: CustomTag = avail_fish[fish_index]
-            cur_fish: list[CustomTag] = list(cur_fish_page.children)
+            cur_fish: list[CustomTag] = cur_fish_page.contents
 
             # This could fail with an IndexError
             try:
@@ -203,7 +249,7 @@ class Angler(PartialAngler):
                 LOGGER.exception("<%s.get_fish_data> had an <IndexError> for `cur_fish_data`", __class__.__name__)
                 return fishing_data
 
-            cur_fish_id_name: Optional[CustomTag] = cur_fish_data.find("a")
+            cur_fish_id_name: Optional[CustomTag] = cur_fish_data.find(_ANCHOR_STRAINER)
             if cur_fish_id_name is None:
                 return fishing_data
 
@@ -211,7 +257,7 @@ class Angler(PartialAngler):
             if poss_cur_fish_id is None or isinstance(poss_cur_fish_id, AttributeValueList):
                 return fishing_data
 
-            cur_fish_id = int(poss_cur_fish_id.split("/")[-1])
+            cur_fish_id = int(poss_cur_fish_id.rsplit("/", maxsplit=1)[-1])
 
             # If we find our fish in our results, lets set our flag.
             if cur_fish_id == fish_id:
@@ -219,7 +265,7 @@ class Angler(PartialAngler):
 
             # This could break due to an IndexError.
             try:
-                poss_fish_name: CustomTag = list(cur_fish_id_name.children)[2]
+                poss_fish_name: CustomTag = cur_fish_id_name.contents[2]
             except IndexError:
                 LOGGER.warning("<%s.get_fish_data> had an <IndexError> for `poss_fish_name`", __class__.__name__)
                 continue
@@ -278,7 +324,7 @@ class Angler(PartialAngler):
             # Checking Fish Tug information in a new section.
             try:
                 possible_tug_data: CustomTag = cur_fish[7]
-                tug_section: bs4AtMostOneElement = possible_tug_data.find(class_="tug_sec")
+                tug_section: bs4AtMostOneElement = possible_tug_data.find(_TUG_SEC_STRAINER)
                 cur_fish_tug = None if tug_section is None or tug_section.string is None else tug_section.string.strip()
 
             except IndexError:
@@ -288,7 +334,7 @@ class Angler(PartialAngler):
             # Checking Fish Double Hook information in a new section.
             try:
                 cur_fish_double_data: CustomTag = cur_fish[9]
-                cur_fish_double_page: Optional[CustomTag] = cur_fish_double_data.find(class_="strong")
+                cur_fish_double_page: Optional[CustomTag] = cur_fish_double_data.find(_STRONG_STRAINER)
                 if cur_fish_double_page is not None and cur_fish_double_page.string is not None:
                     cur_fish_double = int(cur_fish_double_page.string.strip()[1:])
                 else:
@@ -306,7 +352,7 @@ class Angler(PartialAngler):
 
         effective_bait_header: Optional[CustomTag] = soup.find(id="effective_bait")
         if effective_bait_header is not None:
-            effective_bait: list[CustomTag] = list(effective_bait_header.children)
+            effective_bait: list[CustomTag] = effective_bait_header.contents
 
             # get the bait IDs and insert them into the data set
             # We will be using this list layout as our index into `fishing_data`.
@@ -320,18 +366,17 @@ class Angler(PartialAngler):
 
             # all entries have a blank gap, we also skip the first box as
             # it is empty due to the grid design
-            fish_entries: list[CustomTag] = list(poss_entries.children)
             # This is used for `fish_id` to break early with the exact data.
             fish_index = -1
-            for index in range(3, len(fish_entries), 2):
-                cur_fish_entry: Optional[CustomTag] = fish_entries[index].find("a")
+            for fish_entry in itertools.islice(poss_entries.children, 3, None, 2):
+                cur_fish_entry: Optional[CustomTag] = fish_entry.find(_ANCHOR_STRAINER)
                 # poss_fish_name: Optional[_AttributeValue] = cur_fish_entry.get("title")
                 if cur_fish_entry is None:
                     continue
                 poss_fish_id: Optional[bs4AttributeValue] = cur_fish_entry.get("href")
                 if isinstance(poss_fish_id, str):
                     # If our fish id in the header matches our passed in fish_id
-                    cur_fish_id = int(poss_fish_id.split("/")[-1])
+                    cur_fish_id = int(poss_fish_id.rsplit("/", maxsplit=1)[-1])
                     fish_ids.append(cur_fish_id)
                     if fish_id and cur_fish_id == fish_id:
                         fish_index = len(fish_ids) - 1
@@ -339,21 +384,21 @@ class Angler(PartialAngler):
 
             # now cycle through and grab % values for each fish, similar to the above
             # every other entry is blank
-            for bait_index in range(3, len(effective_bait), 2):
-                bait_numbers: list[CustomTag] = list(effective_bait[bait_index].children)
+            for bait_row in effective_bait[3::2]:
+                bait_numbers: list[CustomTag] = bait_row.contents
                 try:
                     bait_info_page: CustomTag = bait_numbers[0]
                 except IndexError:
                     LOGGER.warning("<%s.get_fish_data> had an <IndexError> for `cur_bait_info_page`", __class__.__name__)
                     continue
 
-                bait_info: Optional[CustomTag] = bait_info_page.find("a")
+                bait_info: Optional[CustomTag] = bait_info_page.find(_ANCHOR_STRAINER)
                 if bait_info is None:
                     continue
 
                 poss_id: Optional[bs4AttributeValue] = bait_info.get("href", None)
                 if isinstance(poss_id, str):
-                    bait_id = int(poss_id.split("/")[-1])
+                    bait_id = int(poss_id.rsplit("/", maxsplit=1)[-1])
                 else:
                     LOGGER.warning(
                         "<%s.get_fish_data> encountered a <TypeError>, `poss_id`. | Type: %s ",
@@ -369,7 +414,7 @@ class Angler(PartialAngler):
                 if fish_id is not None and fish_index != -1:
                     cur_bait_index = (fish_index * 2) + 2
                     if len(bait_numbers) > cur_bait_index:
-                        add_bait_info_header: Optional[CustomTag] = bait_numbers[cur_bait_index].find("canvas")
+                        add_bait_info_header: Optional[CustomTag] = bait_numbers[cur_bait_index].find(_CANVAS_STRAINER)
                         if add_bait_info_header is None:
                             continue
                         page_percent: Optional[bs4AttributeValue] = add_bait_info_header.get("value")
@@ -378,13 +423,13 @@ class Angler(PartialAngler):
 
                             fishing_data[fish_id]["baits"][bait_id] = {
                                 "bait_name": bait_name,
-                                "hook_percent": float(format(bait_percent, ".2f")),
+                                "hook_percent": round(bait_percent, 2),
                             }
                 else:
                     for cur_bait_index in range(2, len(bait_numbers), 2):
                         if int(fish_ids[int((cur_bait_index - 2) / 2)]) == fish_index:
                             break
-                        add_bait_info_header: Optional[CustomTag] = bait_numbers[cur_bait_index].find("canvas")
+                        add_bait_info_header: Optional[CustomTag] = bait_numbers[cur_bait_index].find(_CANVAS_STRAINER)
                         if add_bait_info_header is None:
                             continue
                         page_percent: Optional[bs4AttributeValue] = add_bait_info_header.get("value")
@@ -393,11 +438,18 @@ class Angler(PartialAngler):
                             cur_fish_id = int(fish_ids[int((cur_bait_index - 2) / 2)])
                             fishing_data[cur_fish_id]["baits"][bait_id] = {
                                 "bait_name": bait_name,
-                                "hook_percent": float(format(bait_percent, ".2f")),
+                                "hook_percent": round(bait_percent, 2),
                             }
         if flag is True and fish_id is not None:
-            return fishing_data[fish_id]
-        return fishing_data
+            if len(self._fish_cache) >= _FISH_CACHE_SIZE:
+                del self._fish_cache[next(iter(self._fish_cache))]
+            self._fish_cache[location_id, fish_id] = fishing_data[fish_id]
+            return copy.deepcopy(fishing_data[fish_id])
+        # Our fish wasn't found (or we weren't after one), so the entire spot page was parsed.
+        if len(self._location_cache) >= _LOCATION_CACHE_SIZE:
+            del self._location_cache[next(iter(self._location_cache))]
+        self._location_cache[location_id] = fishing_data
+        return copy.deepcopy(fishing_data)
 
     def match_select_spot(self, tag: bs4.Tag) -> bool:
         """Creates a generic `bs4.Tag` with set values to check against within the `bs4.BeautifulSoup.find()` name parameter.
@@ -450,7 +502,7 @@ class Angler(PartialAngler):
             A dictionary of `location_name: ff14angler_location_id`.
 
         """
-        url = "https://en.ff14angler.com/"
+        url = ANGLER_BASE_URL
         fishing_html_data: Optional[bytes] = await self._request(url=url)
         if fishing_html_data is None:
             LOGGER.error("<%s.get_location_id_mapping> failed to get data from url: %s", __class__.__name__, url)
@@ -458,7 +510,7 @@ class Angler(PartialAngler):
 
         # fishing_html_data: bytes = await self.request_file_data(url=url)
 
-        soup = AnglerSoup(fishing_html_data, "html.parser")
+        soup = AnglerSoup(fishing_html_data)
         locations: dict[str, int] = {}
 
         # get the available locations and their IDs
@@ -511,10 +563,13 @@ class Angler(PartialAngler):
 
         """
         LOGGER.debug("Fetching FF14Angler Fish location data for Fish ID: %s", fish_id)
-        url = "https://en.ff14angler.com/fish/" + str(fish_id)
+        url = ANGLER_FISH_URL + str(fish_id)
         fishing_html_data: Optional[bytes] = await self._request(url=url)
+        if fishing_html_data is None:
+            LOGGER.error("<%s.get_fish_locations> failed to get data from url: %s", __class__.__name__, url)
+            return None
 
-        soup = AnglerSoup(fishing_html_data, "html.parser")
+        soup = AnglerSoup(fishing_html_data)
 
         # just a list of IDs for locations
         locations: list[int] = []
@@ -525,18 +580,21 @@ class Angler(PartialAngler):
             return locations
         try:
             # get the available fish, skipping headers/etc
-            avail_locations: list[CustomTag] = list(list(page_data.children)[3].children)
+            avail_locations: list[CustomTag] = page_data.contents[3].contents
         except IndexError:
             LOGGER.exception("<%s.get_fish_location> had an <IndexError> for `avail_locations`.", __class__.__name__)
             return None
 
-        for cur_loc_index in range(1, len(avail_locations), 2):
-            cur_loc: list[CustomTag] = list(avail_locations[cur_loc_index].children)
-            cur_loc_info: CustomTag | None = cur_loc[0].find("a")
+        for cur_loc in avail_locations[1::2]:
+            # We only need the first child of each row.
+            cur_loc_page: Optional[CustomTag] = next(cur_loc.children, None)
+            if cur_loc_page is None:
+                continue
+            cur_loc_info: CustomTag | None = cur_loc_page.find(_ANCHOR_STRAINER)
             if cur_loc_info is not None:
                 temp: Optional[bs4AttributeValue] = cur_loc_info.get("href")
                 if isinstance(temp, str):
-                    cur_loc_id = int(temp.split("/")[-1])
+                    cur_loc_id = int(temp.rsplit("/", maxsplit=1)[-1])
                     locations.append(cur_loc_id)
 
         return locations
@@ -576,10 +634,13 @@ class Angler(PartialAngler):
             A dictionary of `fish_name: fish_id`.
 
         """
-        url = "https://en.ff14angler.com/"
+        url = ANGLER_BASE_URL
         fishing_html_data: Optional[bytes] = await self._request(url=url)
+        if fishing_html_data is None:
+            LOGGER.error("<%s.get_fish_id_mapping> failed to get data from url: %s", __class__.__name__, url)
+            return None
 
-        soup = AnglerSoup(fishing_html_data, "html.parser")
+        soup = AnglerSoup(fishing_html_data)
         fish: dict[str, int] = {}
 
         page_data: CustomTag | None = soup.find(self.match_select_fish)
@@ -611,8 +672,18 @@ class AnglerSoup(bs4.BeautifulSoup):
         - This alleviates the littered `isinstance()` checks on commonly used functions.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+    def __init__(self, markup: str | bytes = "", features: str = "lxml", **kwargs: Any) -> None:
+        # The `lxml` tree builder is considerably faster than the pure Python `html.parser`,
+        # but we can still parse the pages if it is unavailable.
+        try:
+            super().__init__(markup, features, **kwargs)
+        except bs4.FeatureNotFound:
+            LOGGER.warning(
+                "<%s.__init__> | Tree builder not found, falling back to `html.parser`. | features: %s",
+                __class__.__name__,
+                features,
+            )
+            super().__init__(markup, "html.parser", **kwargs)
 
     def find(self, *args: Any, **kwargs: bs4StrainableAttr) -> Optional[CustomTag]:
         """Uses the build in `bs4.BeautifulSoup.find` via `super()` to overwrite the return type into something more manageable.
@@ -644,6 +715,9 @@ class AnglerSoup(bs4.BeautifulSoup):
 class CustomTag(bs4.Tag):
     """Class is purely for typing overwrites, do not build/use."""
 
+    # The direct children of this `PageElement`, indexing this avoids copying `children` into a new list.
+    contents: list[CustomTag]  # pyright: ignore[reportIncompatibleVariableOverride]
+
     @property
     def children(self) -> Iterator[CustomTag]:
         """Overwrites the type from `bs4.Tag` -> `Iterator[PageElement]` into an `Iterator[CustomTag]`.
@@ -715,15 +789,17 @@ class AnglerBaits(PartialAngler):
     ----------
     bait_name: :class:`str`
         The name of the FF14 bait.
-    hook_percent: :class:`float | int`
+    hook_percent: :class:`float`
         The percent chance catch if using the specified `bait_name` for the `<AnglerFish>` class.
 
     """
 
     bait_name: str
-    hook_percent: float | int
+    hook_percent: float
     _raw: Baits
 
+    __slots__ = ("_raw", "bait_name", "hook_percent")
+
     def __init__(self, data: Baits) -> None:
         """Build the :class:`AnglerBaits` object.
 
@@ -733,7 +809,8 @@ class AnglerBaits(PartialAngler):
             _description_.
 
         """
-        LOGGER.debug("<%s.__init__()> data: %s", __class__.__name__, data)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("<%s.__init__()> data: %s", __class__.__name__, data)
         self._raw = data
         for key, value in data.items():
             setattr(self, key, value)
@@ -781,10 +858,13 @@ class AnglerFish:
 
     _raw: FishingData
 
+    # One of these is built per fish per spot, slots keep them small.
+    __slots__ = ("_raw", "baits", "double_fish", "fish_name", "hook_time", "item_id", "location_name", "restrictions")
+
     @property
     def ff14angler_url(self) -> str:
         """The FF14Angler website url for the Fish."""
-        return f"https://en.ff14angler.com/fish/{self.item_id}"
+        return ANGLER_FISH_URL + str(self.item_id)
 
     def __init__(self, item_id: int, data: FishingData, location_name: Optional[str] = None) -> None:
         """Build your :class:`AnglerFish` object.
@@ -799,7 +879,9 @@ class AnglerFish:
             The FF14 Angler fishing location, by default None.
 
         """
-        LOGGER.debug("<%s.__init__()> location: %s | data: %s", __class__.__name__, location_name, data)
+        # Built for every fish row of a spot page, so only format the data when debug logging is enabled.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("<%s.__init__()> location: %s | data: %s", __class__.__name__, location_name, data)
         self._raw = data
         self.item_id = item_id
         self.location_name = location_name
@@ -817,9 +899,9 @@ class AnglerFish:
         return self.__repr__()
 
     def __repr__(self) -> str:  # noqa: D105
-        return f"\n\n__{self.__class__.__name__}__\n" + "\n".join([
-            f"{e}: {getattr(self, e)}" for e in sorted(self.__dict__) if e.startswith("_") is False
-        ])
+        return f"\n\n__{self.__class__.__name__}__\n" + "\n".join(
+            f"{e}: {getattr(self, e, None)}" for e in sorted(self.__slots__) if e.startswith("_") is False
+        )
 
     def best_bait(self) -> Optional[AnglerBaits]:
         """Retrieves the optimal chance Fishing bait related to the `<AnglerFish.location_name>` class.
@@ -25,7 +25,7 @@ from typing import Optional, TypedDict
 
 class Baits(TypedDict):
     bait_name: str
-    hook_percent: float | int | str
+    hook_percent: float
 
 
 class FishingData(TypedDict):
@@ -20,28 +20,38 @@ Software Foundation, 51 Franklin Street - Fifth Floor, Boston, MA
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import contextlib
 import csv
+import functools
 import json
 import logging
-from io import TextIOWrapper
+import mmap
+import re
+import threading
+import time
+from io import StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Self, Union, Unpack, overload
 
-import aiohttp
-from thefuzz import fuzz  # type: ignore[reportMissingStubFile]
+from rapidfuzz import fuzz, process, utils
 from universalis import CurrentData, HistoryData, ItemQuality, UniversalisAPI
 
+from moogle_intuition._utils import local_session, slot_names
 from moogle_intuition.errors import MoogleLookupError
 from moogle_intuition.ff14angler._types import FishingData
 
 from ._enums import CraftType, EquipSlotCategory, FishingSpotCategory, InventoryLocation
-from .ff14angler import Angler, AnglerBaits, AnglerFish
+from .ff14angler import ANGLER_BASE_URL, ANGLER_FISH_URL, ANGLER_SPOT_URL, Angler, AnglerBaits, AnglerFish
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
-    from types import TracebackType
+    from collections.abc import Callable, Collection, Generator, Iterable, Iterator
+    from enum import Enum
+    from types import NotImplementedType, TracebackType
+    from typing import BinaryIO, TextIO
 
-    from aiohttp import ClientResponse
+    import aiohttp
     from aiohttp.client import _RequestOptions as AiohttpRequestOptions  # pyright: ignore[reportPrivateUsage]
 
     from moogle_intuition.ff14angler._types import FishingData
@@ -80,11 +90,17 @@ if TYPE_CHECKING:
         SpearFishingNotebookData,
     ]
 
+# `orjson` is an optional dependency (`pip install moogle_intuition[speed]`), we fall back to `json` when it is missing.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 __all__ = ("ATOOLS_OMIT_INV_LOCS", "IGNORED_KEYS", "PRE_FORMATTED_KEYS", "URLS", "Builder", "Item", "Moogle")
 
 LOGGER = logging.getLogger(__name__)
-DATA_PATH: Path = Path(__file__).parent.joinpath("xiv_datamining")
+_MODULE_PATH: Path = Path(__file__).parent
+DATA_PATH: Path = _MODULE_PATH.joinpath("xiv_datamining")
 
 PRE_FORMATTED_KEYS: dict[str, str] = {
     "ItemID": "item_id",
@@ -95,7 +111,7 @@ PRE_FORMATTED_KEYS: dict[str, str] = {
     "UIPriority": "ui_priority",
     "OH_percent": "oh_percent",
 }
-IGNORED_KEYS: list[str] = [
+IGNORED_KEYS: frozenset[str] = frozenset({
     "CRP",
     "BSM",
     "ARM",
@@ -144,7 +160,7 @@ IGNORED_KEYS: list[str] = [
     "SGE",
     "VPR",
     "PCT",
-]
+})
 
 SANITIZED_VALUES: list[str] = ["<Emphasis>", "</Emphasis>"]
 
@@ -169,6 +185,45 @@ SANITIZED_KEYS: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=2048)
+def _sanitize_key_name(key_name: str) -> str:
+    # Used by `<Builder.sanitize_key_name()>` for the default `SANITIZED_KEYS`.
+    # The same column names show up across most of our CSV files, so the results are cached.
+    # - The replacements must run in the dict's order (eg. `:` is removed before `][` is matched), so they are applied one at a time.
+    for key, value in SANITIZED_KEYS.items():
+        key_name = key_name.replace(key, value)
+    return key_name
+
+
+# Single pass equivalent of `SANITIZED_VALUES` used by `<Builder.sanitize_values()>`.
+_SANITIZED_VALUES_RE: re.Pattern[str] = re.compile("|".join(re.escape(v) for v in SANITIZED_VALUES))
+
+# Used by `<Builder.sanitize_type_name()>`.
+# These values are considered `int` types for the purpose of data parsing/mapping references.
+_INT_TYPE_NAMES: tuple[str, ...] = ("int32", "sbyte", "uint16", "uint32", "bit&10", "byte", "int64", "int16", "Image")
+_BOOL_TYPE_NAMES: tuple[str, ...] = ("bit&", "bool")
+# Most type names match exactly, so we try a dict lookup before the `startswith` checks.
+_TYPE_NAMES: dict[str, str] = {
+    **dict.fromkeys(_BOOL_TYPE_NAMES, "bool"),
+    **dict.fromkeys(_INT_TYPE_NAMES, "int"),
+    "str": "str",
+}
+
+_CAMEL_CASE_RE: re.Pattern[str] = re.compile(r"[A-Z]")
+
+# Used by `<Builder.convert_values()>`.
+_INT_LIST_RE: re.Pattern[str] = re.compile(r"[0-9]+(?:,[0-9]+)+")
+_BOOL_VALUES: dict[str, bool] = {"true": True, "false": False}
+# The CSV columns `<Builder.csv_parse()>` drops from every row.
+_REJECT_KEYS: frozenset[str] = frozenset({"#", "", "Model{Sub}", "Model{Main}"})
+
+
+@functools.lru_cache(maxsize=4096)
+def _camel_to_snake(key_name: str) -> str:
+    # Used by `<Builder.from_camel_case()>`, the same keys are converted for every CSV file so the results are cached.
+    return key_name[:1].lower() + _CAMEL_CASE_RE.sub(r"_\g<0>", key_name[1:]).lower()
+
+
 # https://github.com/xivapi/ffxiv-datamining/tree/master/csv
 # Used when getting files and using `Moogle.data_building()`
 # Simply adding the `file_name` key and the remaining fields, the data will be fetched and converted automatically.
@@ -227,12 +282,97 @@ ATOOLS_OMIT_INV_LOCS: list[InventoryLocation] = [
 
 ATOOLS_OMIT_ITEM_NAMES: list[str] = []
 
+# Used by `<Moogle._parse_atools_csv()>`, the formatted header names of the columns we read from an Allagon Tools export.
+_ATOOLS_CSV_KEYS: tuple[str, ...] = ("favorite", "name", "type", "total_quantity_available", "source", "inventory_location")
+
+# Used by `<InventoryItem._convert_inv_loc_to_enum()>`, the saddlebags are handled separately as they need a left/right check.
+_ATOOLS_INV_LOC_PREFIXES: tuple[tuple[str, InventoryLocation], ...] = (
+    ("bag", InventoryLocation.bag),
+    ("glamour", InventoryLocation.armoire),
+    ("armory", InventoryLocation.armory),
+    ("market", InventoryLocation.market),
+    ("free", InventoryLocation.free_company),
+    ("currency", InventoryLocation.currency),
+    ("equipped", InventoryLocation.equipped_gear),
+    ("crystals", InventoryLocation.crystals),
+)
+
+# Used by `<Item.__len__()>` to count the digits of an item ID without formatting it.
+_POWERS_OF_TEN: tuple[int, ...] = tuple(10**exp for exp in range(1, 19))
+
+# Used by `<InventoryItem.__init__()>` to convert the Allagon Tools `type` column.
+_ATOOLS_ITEM_QUALITY: dict[str, ItemQuality] = {"nq": ItemQuality.NQ, "hq": ItemQuality.HQ}
+
+# Used by `<Recipe.__init__()>`.
+_RECIPE_BOOL_KEYS: frozenset[str] = frozenset({"is_expert", "can_hq", "can_quick_synth"})
+# Used by `<Recipe.ingredients>`, `(item_ingredientX, amount_ingredientX)` slot name pairs.
+_RECIPE_INGREDIENT_KEYS: tuple[tuple[str, str], ...] = tuple((f"item_ingredient{idx}", f"amount_ingredient{idx}") for idx in range(8))
+# Used by `<FishingSpot.items>`.
+_FISHING_SPOT_ITEM_KEYS: tuple[str, ...] = tuple(f"item{idx}" for idx in range(10))
+
+# The most `<Moogle._current_data_cache>` entries we hold onto, the oldest entry is dropped first.
+_MARKETBOARD_CACHE_SIZE: int = 1024
+# The most `<Moogle._query_cache>` entries we hold onto, the least recently used entry is dropped first.
+_QUERY_CACHE_SIZE: int = 8192
+
+# Used by `<Moogle.__getattr__()>`, these tables are only loaded the first time they are accessed.
+# `attribute name : xiv_datamining file name`
+_LAZY_TABLES: dict[str, str] = {
+    "_recipes": "recipe",
+    "_recipe_lookups": "recipe_lookup",
+    "_fish_params": "fish_parameter",
+    "_fishing_spot": "fishing_spot",
+    "_spearfishing_items": "spearfishing_item",
+    "_spearfishing_notebook": "spearfishing_notebook",
+    "_gathering_items": "gathering_item",
+    "_gathering_item_levels": "gathering_item_level",
+    "_place_names": "place_name",
+}
+# `attribute name : (table attribute name, value_get, flip_key_value)`, see `<Moogle._reference_dict()>`.
+_LAZY_REFS: dict[str, tuple[str, str, bool]] = {
+    "_recipes_ref": ("_recipes", "item_result", False),
+    # { item_id : dict ref id for `fish_parameter.json`}
+    "_fish_params_ref": ("_fish_params", "item", True),
+    "_spearfishing_items_ref": ("_spearfishing_items", "item", True),
+    "_gathering_items_ref": ("_gathering_items", "item", True),
+}
+
+
+@functools.cache
+def _enum_members(enum: type[Enum]) -> dict[Any, Enum]:
+    # Used by `<Object._to_enum()>`, a value lookup avoids raising (and catching) a `ValueError` for every unknown value.
+    return {member.value: member for member in enum}
+
+
+@functools.cache
+def _public_slots(cls: type) -> tuple[str, ...]:
+    # Used by `<Object.__repr__()>`, our objects have no `__dict__` so only their public slots are shown.
+    return tuple(sorted(key for key in slot_names(cls) if key.startswith("_") is False))
+
+
+# The modes `<Builder.write_data_to_file()>` accepts, text modes are written out as UTF-8 bytes all the same.
+# Anything that appends to or updates an existing file would be silently overwritten by `<_atomic_write()>`.
+_WRITE_MODES: frozenset[str] = frozenset({"w", "w+", "wb", "wb+", "w+b"})
+
+
+@contextlib.contextmanager
+def _atomic_write(path: Path) -> Generator[BinaryIO]:
+    # Yields a binary handle to a `.tmp` file that is swapped into place as `path` once the block exits cleanly,
+    # on any error (including cancellation) the `.tmp` file is removed so we never leave a partial file behind.
+    temp_path: Path = path.with_name(path.name + ".tmp")
+    try:
+        with temp_path.open(mode="wb") as file:
+            yield file
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
 
 class Object:
     """Our Base object class for FFXIV related object handling."""
 
     _raw: DataTypeAliases
-    _repr_keys: list[str]
     _moogle: Moogle
     # _universalis: Optional[UniversalisAPI]
     # _angler: Optional[Angler]
@@ -249,6 +389,15 @@ class Object:
         8: 33916,
     }
 
+    # Maps a data key to the Enum its `int` value is converted into via `<Object._to_enum()>`.
+    _enum_keys: ClassVar[dict[str, type[Enum]]] = {}
+
+    # Controls the amount of information we return via `__str__()` and `__repr__()` dunder methods.
+    # - If `None`, every populated slot is shown.
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = None
+
+    __slots__ = ("_moogle", "_raw")
+
     def __init__(self, data: DataTypeAliases, *, moogle: Moogle) -> None:
         """Handles setting our `_raw` attribute and setting our `Moogle` class.
 
@@ -262,20 +411,43 @@ class Object:
         """
         self._moogle = moogle
         self._raw = data
-        LOGGER.debug("<%s.__init__()> data: %s", __class__.__name__, data)
+        # Built for every lookup result, so only pay for the dict formatting when debug logging is actually enabled.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("<%s.__init__()> data: %s", __class__.__name__, data)
+
+    def _to_enum(self, key: str, value: int) -> Optional[Enum]:
+        """Convert the `value` of `key` into the Enum mapped in `_enum_keys`.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The data key, must be present in `_enum_keys`.
+        value: :class:`int`
+            The value to convert.
+
+        Returns
+        -------
+        :class:`Optional[Enum]`
+            The Enum member, or `None` if the value is not a member of the Enum.
+
+        """
+        enum: type[Enum] = self._enum_keys[key]
+        member: Optional[Enum] = _enum_members(enum).get(value)
+        if member is None:
+            LOGGER.warning("<%s> | Failed to find value in %s. | value: %s ", type(self).__name__, enum.__name__, value)
+        return member
 
     def __str__(self) -> str:
         return self.__repr__()
 
     def __repr__(self) -> str:
-        try:
-            return f"\n\n__{self.__class__.__name__}__\n" + "\n".join([
-                f"{e}: {getattr(self, e)}" for e in self._repr_keys if e.startswith("_") is False
-            ])
-        except AttributeError:
-            return f"\n\n__{self.__class__.__name__}__\n" + "\n".join([
-                f"{e}: {getattr(self, e)}" for e in sorted(self.__dict__) if e.startswith("_") is False
-            ])
+        keys: Optional[tuple[str, ...]] = self._repr_keys
+        if keys is None:
+            keys = _public_slots(type(self))
+        # Slots that were never populated from the data are shown as `None`.
+        return f"\n\n__{self.__class__.__name__}__\n" + "\n".join(
+            f"{e}: {getattr(self, e, None)}" for e in keys if e.startswith("_") is False
+        )
 
 
 class Generic:
@@ -285,41 +457,41 @@ class Generic:
     session: Optional[aiohttp.ClientSession]
 
     # Item Handling.
-    _items: dict[str, DataTypeAliases]
+    _items: dict[int, DataTypeAliases]
     # I am storing "item id" : "name"
     _items_ref: dict[str | int, str | int]
     # Recipe Handling.
     # I am storing "Recipe ID" : "Item Result ID"
     # recipe_dict: dict[str, int]  # ? Unsure why this was commented out, need to validate usage.
-    _recipes: dict[str, DataTypeAliases]
+    _recipes: dict[int, DataTypeAliases]
     _recipes_ref: dict[str | int, str | int]
 
     # Job Recipe Table
-    _recipe_lookups: dict[str, DataTypeAliases]
+    _recipe_lookups: dict[int, DataTypeAliases]
 
     # Recipe Level Table
-    _recipe_levels: dict[str, DataTypeAliases]
+    _recipe_levels: dict[int, DataTypeAliases]
 
     # Gatherable Items Handling.
     # Using flipped keys in the item_dict for faster lookup of an item.
-    _gathering_items: dict[str, DataTypeAliases]
+    _gathering_items: dict[int, DataTypeAliases]
     _gathering_items_ref: dict[str | int, str | int]
-    _gathering_item_levels: dict[str, DataTypeAliases]
+    _gathering_item_levels: dict[int, DataTypeAliases]
 
     # Fishing Related
-    _fish_params: dict[str, DataTypeAliases]
+    _fish_params: dict[int, DataTypeAliases]
     # This is stored with FLIPPED key to values ("Item ID" : "Dict Index")
     _fish_params_ref: dict[str | int, str | int]
-    _fishing_spot: dict[str, DataTypeAliases]
+    _fishing_spot: dict[int, DataTypeAliases]
 
     # Spearfishing Related
-    _spearfishing_items: dict[str, DataTypeAliases]
+    _spearfishing_items: dict[int, DataTypeAliases]
     # This is stored with FLIPPED key to values ("item id" : "Dict Index")
     _spearfishing_items_ref: dict[str | int, str | int]
-    _spearfishing_notebook: dict[str, DataTypeAliases]
+    _spearfishing_notebook: dict[int, DataTypeAliases]
 
     # Location Information
-    _place_names: dict[str, DataTypeAliases]
+    _place_names: dict[int, DataTypeAliases]
 
 
 class Builder(Generic):
@@ -343,37 +515,54 @@ class Builder(Generic):
         if self._session is not None:
             await self._session.close()
 
-    async def file_validation(self) -> None:
+    async def file_validation(self, *, max_concurrency: int = 5) -> None:
         """Validate's the required files for Moogle to operate.
 
         - Files are located in `xiv_datamining`.
+        - Any missing files are downloaded and built concurrently.
+
+        Parameters
+        ----------
+        max_concurrency: :class:`int`, optional
+            The maximum number of files to download and build at once, by default 5.
+
         """
         LOGGER.info("<%s.%s> | Validating json files... | Path: %s", __class__.__name__, "file_validation", DATA_PATH)
+        missing: list[tuple[str, tuple[bool, str]]] = []
         for key, data in URLS.items():
             # lets check for the json file, which is all we care about to build our data structures.
-            f_path: Path = Path(DATA_PATH).joinpath(key + ".json")
+            f_path: Path = DATA_PATH.joinpath(key + ".json")
+            exists: bool = f_path.exists()
             LOGGER.debug(
                 "<%s.%s> | Validating file... %s. | Exists: %s | Path: %s",
                 __class__.__name__,
                 "file_validation",
                 key,
-                f_path.exists(),
+                exists,
                 f_path,
             )
-            if f_path.exists() is False:
-                if DATA_PATH.exists() is False:
-                    DATA_PATH.mkdir()
-                file_name = key + ".csv"
-
-                res: bytes = await self._request(url=data[1])
-                self.write_data_to_file(path=DATA_PATH, file_name=file_name, data=res)
-                await self.csv_to_json(csv_name=file_name, convert_pound=data[0], format_keys=True)
-                LOGGER.debug(
-                    "<%s.%s> | Finished retrieving and building data for file.| File: %s",
-                    __class__.__name__,
-                    "file_validation",
-                    key,
-                )
+            if exists is False:
+                missing.append((key, data))
+
+        if len(missing) == 0:
+            return
+        if DATA_PATH.exists() is False:
+            DATA_PATH.mkdir()
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        await asyncio.gather(*[self._build_file(key=key, data=data, semaphore=semaphore) for key, data in missing])
+
+    async def _build_file(self, key: str, data: tuple[bool, str], semaphore: asyncio.Semaphore) -> None:
+        file_name = key + ".csv"
+        async with semaphore:
+            await self._download(url=data[1], path=DATA_PATH.joinpath(file_name))
+            await self.csv_to_json(csv_name=file_name, convert_pound=data[0], format_keys=True)
+        LOGGER.debug(
+            "<%s.%s> | Finished retrieving and building data for file.| File: %s",
+            __class__.__name__,
+            "_build_file",
+            key,
+        )
 
     async def csv_to_json(
         self,
@@ -411,19 +600,9 @@ class Builder(Generic):
             typed_file_name = csv_name.split(".", maxsplit=1)[0] + "_typed.py"
         typed_class_name = "XIV" + typed_file_name[:-3]
 
-        if DATA_PATH.joinpath(csv_name).exists():
+        csv_path: Path = DATA_PATH.joinpath(csv_name)
+        if csv_path.exists():
             LOGGER.debug("<%s.%s> | Found the local CSV file. | Name: %s", __class__.__name__, f_name, csv_name)
-            res, keys, types = self.csv_parse(path=DATA_PATH.joinpath(csv_name), **csv_args)
-
-            # ? Suggestion
-            # This will make the JSON file regardless if it exists or not.
-            # Could possible have a flag to prevent overwrite.. unsure.
-            self.write_data_to_file(path=DATA_PATH, file_name=json_name, data=res)
-
-            if typed_dict:
-                res = self.to_typed_dict(class_name=typed_class_name, keys=keys, key_types=types)
-                self.write_data_to_file(path=DATA_PATH, file_name=typed_file_name, data=res)
-
         else:
             # In case we cannot find the local file we can use our pre-built URLS dict to
             # get the CSV file from the `xivapi` Github repo else prompt for a url.
@@ -434,44 +613,79 @@ class Builder(Generic):
             else:
                 url = key_data[1]
 
-            data: bytes = await self._request(url=url)
-            self.write_data_to_file(path=DATA_PATH, file_name=csv_name, data=data)
-            await self.csv_to_json(csv_name=csv_name, typed_dict=typed_dict, **csv_args)
+            await self._download(url=url, path=csv_path)
+
+        # Parsing is CPU bound, running it in a thread lets the other downloads in `file_validation` continue.
+        # ? Suggestion
+        # This will make the JSON file regardless if it exists or not.
+        # Could possible have a flag to prevent overwrite.. unsure.
+        keys, types = await asyncio.to_thread(self.csv_parse_to_json, path=csv_path, json_name=json_name, **csv_args)
+
+        if typed_dict:
+            res = self.to_typed_dict(class_name=typed_class_name, keys=keys, key_types=types)
+            self.write_data_to_file(path=DATA_PATH, file_name=typed_file_name, data=res)
 
         # Remove the CSV files since we don't need them after they have been converted.
         LOGGER.debug("<%s.%s> | Removing CSV file. | Name: %s", __class__.__name__, f_name, csv_name)
-        DATA_PATH.joinpath(csv_name).unlink()
-
-    async def _request(self, url: str, **request_options: Unpack[AiohttpRequestOptions]) -> bytes:
-        if self.session is None:
-            if self._session is None:
-                session: aiohttp.ClientSession = aiohttp.ClientSession()
-                self._session = session
-                LOGGER.debug("<%s._request> | Creating local `aiohttp.ClientSession()` | session: %s", __class__.__name__, session)
-            else:
-                session = self._session
-        else:
-            session = self.session
+        await asyncio.to_thread(csv_path.unlink)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is not None:
+            return self.session
+        self._session = local_session(self._session)
+        return self._session
+
+    async def _download(
+        self,
+        url: str,
+        path: Path,
+        *,
+        chunk_size: int = 65536,
+        **request_options: Unpack[AiohttpRequestOptions],
+    ) -> None:
+        """Stream the response body of `url` to `path` in chunks, rather than holding the entire file in memory.
 
-        res: ClientResponse = await session.get(url=url, **request_options)
-        if res.status != 200:
-            msg = "Unable to access the URL provided: %s"
-            raise ConnectionError(msg, url)
+        .. note::
+            The data is written to a temporary file first and swapped into place once the download completes.
 
-        if res.content_type == "application/json":
-            return await res.json()
-        return await res.content.read()
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL to download.
+        path: :class:`Path`
+            The file path to write the data to.
+        chunk_size: :class:`int`, optional
+            The number of bytes to read from the response per chunk, by default 65536.
+        **request_options: :class:`Unpack[AiohttpRequestOptions]`
+            Any additional options to supply to `<aiohttp.ClientSession.get()>`.
+
+        """
+        session: aiohttp.ClientSession = self._get_session()
+        async with session.get(url=url, **request_options) as res:
+            if res.status != 200:
+                msg = f"Unable to access the URL provided: {url} | Status Code: {res.status}"
+                raise ConnectionError(msg)
+
+            with _atomic_write(path) as file:
+                async for chunk in res.content.iter_chunked(chunk_size):
+                    file.write(chunk)
+        LOGGER.debug("<%s.%s> | Downloaded file. | URL: %s | Path: %s", __class__.__name__, "_download", url, path)
 
     def write_data_to_file(
         self,
         file_name: str,
         data: bytes | dict[Any, Any] | str,
-        path: Path = Path(__file__).parent,
+        path: Path = _MODULE_PATH,
         *,
         mode: str = "w+",
         **kwargs: Any,
     ) -> None:
-        """Basic file dump with json handling. If the data parameter is of type `dict`, `json.dumps()` will be used with an indent of 4.
+        """Basic file dump with json handling. If the data parameter is of type `dict`, it will be serialized to JSON with an indent of 2.
+
+        .. note::
+            When `orjson` is installed and no `kwargs` are provided, dicts are serialized with `orjson.dumps()`,
+            otherwise `json.dumps()` is used. Both produce the same output.
 
         Parameters
         ----------
@@ -482,20 +696,36 @@ class Builder(Generic):
         data: :class:`bytes | dict | str`
             The data to write out to the path and file_name provided.
         mode: :class:`str`, optional
-            The mode to open the provided file path with using `<Path.open()>`.
+            The write mode to use, by default "w+".
+            - The file is always replaced as a whole and written as UTF-8, so appending or updating modes (eg. "a", "r+") are not supported.
         **kwargs: :class:`Any`
             Any additional kwargs to be supplied to `<json.dumps()>`, if applicable.
+            - Such as `indent=None` for compact output.
+
+        Raises
+        ------
+        ValueError
+            If the `mode` provided is not a truncating write mode.
 
         """
+        if mode not in _WRITE_MODES:
+            msg = f"Only truncating write modes are supported. | Mode: {mode}"
+            raise ValueError(msg)
         file_name = file_name.lower()
-        with path.joinpath(file_name).open(mode=mode) as file:
-            LOGGER.debug("<%s.%s> | Wrote data to file %s located at: %s", __class__.__name__, "write_data_to_file", path, file_name)
-            if isinstance(data, bytes):
-                file.write(data.decode(encoding="utf-8"))
-            elif isinstance(data, dict):
-                file.write(json.dumps(data, indent=4, **kwargs))
+        if isinstance(data, dict):
+            if orjson is not None and not kwargs:
+                # `OPT_NON_STR_KEYS` lets `int` keys through, the same as `json.dumps()`.
+                data = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
             else:
-                file.write(data)
+                # Matches the `orjson` output above, which only supports an indent of 2 and never escapes non-ASCII characters.
+                kwargs.setdefault("indent", 2)
+                kwargs.setdefault("ensure_ascii", False)
+                data = json.dumps(data, **kwargs)
+        if isinstance(data, str):
+            data = data.encode(encoding="utf-8")
+        with _atomic_write(path.joinpath(file_name)) as file:
+            LOGGER.debug("<%s.%s> | Wrote data to file %s located at: %s", __class__.__name__, "write_data_to_file", path, file_name)
+            file.write(data)
         LOGGER.info(
             "<%s.%s> | File write successful to path: %s ",
             __class__.__name__,
@@ -503,6 +733,52 @@ class Builder(Generic):
             path.joinpath(file_name).as_posix(),
         )
 
+    def write_json_rows(
+        self,
+        file_name: str,
+        rows: Iterable[tuple[str, dict[str, Any]]],
+        path: Path = _MODULE_PATH,
+    ) -> None:
+        """Write `key : value` pairs out as a single JSON object, serializing one row at a time.
+
+        .. note::
+            The output is the same as a compact `json.dumps(dict(rows))`,
+            without building the entire dict or JSON payload in memory first.
+
+
+        Parameters
+        ----------
+        file_name: :class:`str`
+            The name of the file, include the file extension.
+        rows: :class:`Iterable[tuple[str, dict[str, Any]]]`
+            The `(key, value)` pairs to write out, duplicate keys are not checked for.
+        path: :class:`Path`, optional
+            The Path to write the data, default's to `Path(__file__).parent`.
+
+        """
+        file_name = file_name.lower()
+        if orjson is not None:
+            dumps: Callable[[Any], bytes] = orjson.dumps
+            key_sep, item_sep = b":", b","
+        else:
+            # Matches the default `json.dumps()` separators so the output is the same as a single `json.dumps()` call.
+            dumps = lambda obj: json.dumps(obj).encode(encoding="utf-8")  # noqa: E731
+            key_sep, item_sep = b": ", b", "
+        # `rows` is usually a generator still reading the CSV file, so a bad row can fail part way through the write.
+        with _atomic_write(path.joinpath(file_name)) as file:
+            file.write(b"{")
+            sep = b""
+            for key, value in rows:
+                file.writelines((sep, dumps(key), key_sep, dumps(value)))
+                sep = item_sep
+            file.write(b"}")
+        LOGGER.info(
+            "<%s.%s> | File write successful to path: %s ",
+            __class__.__name__,
+            "write_json_rows",
+            path.joinpath(file_name).as_posix(),
+        )
+
     def csv_parse(
         self,
         path: Path,
@@ -531,62 +807,118 @@ class Builder(Generic):
             The Sanatized Data from the CSV file, along with the Keys and Types related to those Keys.
 
         """
-        with path.open(mode="r", encoding="utf-8") as file:
-            # so first off we need the key/type pairing, read those, skipping the first line
-            # that is useless
-            data = file.readline()
-            keys: list[str] = file.readline()[0:-1].split(",")
-            types: list[str] = file.readline()[0:-1].split(",")
-
-            # This line appears to be "ItemID" 0 which has no value based upon the CSV inspection.
-            data = file.readline()
-
-            # Take our data and turn it into a dict, using the second line of the CSV file as the Keys.
-            data = csv.DictReader(file, fieldnames=keys)
-            outdata: dict[str, dict[str, str]] = {}
-
-            for entry in data:
-                outdata[entry["#"]] = entry
-            file.close()
-
-            reject_keys: list[str] = ["#", "", "Model{Sub}", "Model{Main}"]
-            sanitized_data: dict[str, dict[str, int | str | list[int] | bool | None]] = {}
-            for item, value in outdata.items():
-                sanitized_data[item] = {}
-                for k, v in value.items():
-                    _k = k
-                    # The Pound symbol from item.csv is the Item ID.
-                    if k == "#" and convert_pound:
-                        _k = "id"
-
-                    # Removes the unused keys.
-                    elif k in reject_keys:
-                        continue
-
-                    # ? Suggestion
-                    # Pep 8 all "keys" as they will be used as attributes for the TypedDict/Class objects.
-                    if format_keys is True:
-                        _k: str = self.from_camel_case(key_name=self.sanitize_key_name(key_name=_k))
-                    else:
-                        _k: str = self.sanitize_key_name(key_name=k)
-                    _v: str = self.sanitize_values(value=v)
-                    sanitized_data[item][_k] = self.convert_values(value=_v)
-
-            if format_keys is True:
-                return (
-                    sanitized_data,
-                    [self.from_camel_case(key_name=self.sanitize_key_name(key_name=i)) for i in keys],
-                    [self.sanitize_type_name(type_name=i) for i in types],
-                )
-            return (
-                sanitized_data,
-                [self.sanitize_key_name(key_name=i) for i in keys],
-                [self.sanitize_type_name(type_name=i) for i in types],
-            )
+        # `newline=""` hands line endings to the csv module untranslated, and the larger buffer
+        # cuts down on the number of reads for the bigger sheets such as `item.csv`.
+        with path.open(mode="r", encoding="utf-8", newline="", buffering=1 << 20) as file:
+            formatted_keys, type_names, rows = self._csv_rows(file, convert_pound=convert_pound, format_keys=format_keys)
+            # Build our sanitized rows directly from the CSV rows, keyed by the value of the "#" column.
+            sanitized_data: dict[str, dict[str, int | str | list[int] | bool | None]] = dict(rows)
+
+        return (sanitized_data, formatted_keys, type_names)
+
+    def csv_parse_to_json(
+        self,
+        path: Path,
+        json_name: str,
+        *,
+        convert_pound: bool = True,
+        format_keys: bool = True,
+    ) -> tuple[list[str], list[str]]:
+        """Parse a CSV file and stream each sanitized row straight into a JSON file located in `DATA_PATH`.
+
+        .. note::
+            Unlike `<Builder.csv_parse()>` the parsed rows are never held in memory all at once.
+
+
+        Parameters
+        ----------
+        path: :class:`Path`
+            The Path to the CSV file.
+        json_name: :class:`str`
+            The name of the JSON file to write, include the file extension.
+        convert_pound: :class:`bool`, optional
+            If the initial key value in the CSV should be changed to `id`.
+        format_keys: :class:`bool`, optional
+            If the keys should be formatted via `<Builder.from_camel_case()>`, by default True.
+
+        Returns
+        -------
+        :class:`tuple[list[str], list[str]]`
+            The Keys and Types from the CSV file.
+
+        """
+        with path.open(mode="r", encoding="utf-8", newline="", buffering=1 << 20) as file:
+            formatted_keys, type_names, rows = self._csv_rows(file, convert_pound=convert_pound, format_keys=format_keys)
+            self.write_json_rows(path=DATA_PATH, file_name=json_name, rows=rows)
+        return (formatted_keys, type_names)
+
+    def _csv_rows(
+        self,
+        file: TextIO,
+        *,
+        convert_pound: bool,
+        format_keys: bool,
+    ) -> tuple[list[str], list[str], Iterator[tuple[str, dict[str, int | str | list[int] | bool | None]]]]:
+        reader = csv.reader(file)
+        # so first off we need the key/type pairing, read those, skipping the first line
+        # that is useless
+        next(reader)
+        keys: list[str] = next(reader)
+        types: list[str] = next(reader)
+
+        # This line appears to be "ItemID" 0 which has no value based upon the CSV inspection.
+        next(reader)
+
+        # Pep 8 all "keys" as they will be used as attributes for the TypedDict/Class objects.
+        if format_keys is True:
+            formatted_keys: list[str] = [self.from_camel_case(key_name=self.sanitize_key_name(key_name=i)) for i in keys]
+        else:
+            formatted_keys = [self.sanitize_key_name(key_name=i) for i in keys]
+
+        type_names: list[str] = [self.sanitize_type_name(type_name=i) for i in types]
+
+        # The columns are the same for every row, so we resolve each column's sanitized key once up front.
+        # `None` marks a column we don't keep.
+        col_keys: list[Optional[str]] = []
+        for k, formatted in zip(keys, formatted_keys, strict=True):
+            # The Pound symbol from item.csv is the Item ID.
+            if k == "#" and convert_pound:
+                col_keys.append("id")
+            # Removes the unused keys.
+            elif k in _REJECT_KEYS:
+                col_keys.append(None)
+            else:
+                col_keys.append(formatted)
+        pound_idx: int = keys.index("#")
+        # Only text columns can contain markup such as `<Emphasis>`, so `int` and `bool` columns skip `<Builder.sanitize_values()>`.
+        text_cols: list[bool] = [type_name not in ("int", "bool") for type_name in type_names]
+
+        return (formatted_keys, type_names, self._iter_csv_rows(reader, col_keys, text_cols, pound_idx))
+
+    def _iter_csv_rows(
+        self,
+        reader: Iterator[list[str]],
+        col_keys: list[Optional[str]],
+        text_cols: list[bool],
+        pound_idx: int,
+    ) -> Iterator[tuple[str, dict[str, int | str | list[int] | bool | None]]]:
+        # Yields `(value of the "#" column, sanitized row)` one CSV row at a time.
+        for entry in reader:
+            # Blank lines (such as a trailing newline) and rows cut off before the "#" column have nothing to key on,
+            # `csv.DictReader` skipped blank lines for us so we do the same.
+            if not entry or len(entry) <= pound_idx:
+                continue
+            row: dict[str, int | str | list[int] | bool | None] = {}
+            # A short (truncated) row only drops its trailing columns, rather than failing the entire file.
+            for k, is_text, v in zip(col_keys, text_cols, entry, strict=False):
+                if k is None:
+                    continue
+                row[k] = self.convert_values(value=self.sanitize_values(value=v) if is_text else v)
+            yield entry[pound_idx], row
 
     @staticmethod
     def sanitize_values(value: str, _sanitize_values: Optional[list[str]] = None) -> str:
-        """Using `.find()` to locate the entry from `_sanitize_values` will use `.replace()` of an empty str `""`.
+        """Removes every entry of `_sanitize_values` from the value, replacing it with an empty str `""`.
 
         Parameters
         ----------
@@ -601,9 +933,11 @@ class Builder(Generic):
             The sanitized string.
 
         """
-        sanitize = SANITIZED_VALUES if _sanitize_values is None else _sanitize_values
-        for entry in sanitize:
-            if value.find(entry):
+        if _sanitize_values is None:
+            # Called for every cell of every CSV, so the defaults are stripped in one regex pass.
+            return _SANITIZED_VALUES_RE.sub("", value)
+        for entry in _sanitize_values:
+            if entry in value:
                 value = value.replace(entry, "")
         return value
 
@@ -633,6 +967,8 @@ class Builder(Generic):
         # some fields have {} and other symbols that must be sanitized
         if len(key_name) > 1 and key_name[0].isnumeric():
             key_name = key_name.replace("1", "one").replace("2", "two")
+        if keys is SANITIZED_KEYS:
+            return _sanitize_key_name(key_name)
         for key, value in keys.items():
             key_name = key_name.replace(key, value)
         # key_name = key_name.replace(":", "")
@@ -650,7 +986,7 @@ class Builder(Generic):
     def from_camel_case(
         key_name: str,
         *,
-        ignored_keys: Optional[list[str]] = None,
+        ignored_keys: Optional[Collection[str]] = None,
         pre_formatted_keys: Optional[dict[str, str]] = None,
     ) -> str:
         """Resolve a camelCase string to snake_case.
@@ -668,7 +1004,7 @@ class Builder(Generic):
         ----------
         key_name: :class:`str`
             The string to format.
-        ignored_keys: :class:`Optional[list[str]]`, optional
+        ignored_keys: :class:`Optional[Collection[str]]`, optional
             An array of strings that if the `key_name` is in the array it will be ignored and instantly returned unformatted.
             - You may provide your own, or use the constant `IGNORED_KEYS`
         pre_formatted_keys: :class:`Optional[dict[str, str]]`, optional
@@ -690,18 +1026,18 @@ class Builder(Generic):
         if key_name in ignored_keys:
             return key_name
 
-        for k, v in pre_formatted_keys.items():
-            if key_name == k:
-                LOGGER.debug("<%s.%s> | Replaced `key` and `value` | Key: %s | Value: %s", __class__.__name__, "from_camel_case", k, v)
-                return v
+        formatted: Optional[str] = pre_formatted_keys.get(key_name)
+        if formatted is not None:
+            return formatted
 
-        temp: str = key_name[:1].lower()
-        for e in key_name[1:]:
-            if e.isupper():
-                temp += f"_{e.lower()}"
-                continue
-            temp += e
-        LOGGER.debug("<%s.from_camel_case> | key_name: %s | Converted: %s", __class__.__name__, key_name, temp)
+        # Already snake_case (or single word) keys convert to themselves.
+        if key_name.islower():
+            return key_name
+
+        temp: str = _camel_to_snake(key_name)
+        # This runs for every column of every CSV file, so skip building the log record unless someone is listening.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("<%s.from_camel_case> | key_name: %s | Converted: %s", __class__.__name__, key_name, temp)
         return temp
 
     @staticmethod
@@ -722,22 +1058,12 @@ class Builder(Generic):
             The replaced type_name as a string.
 
         """
-        # These values are considered `int` types for the purpose of data parsing/mapping references.
-        int_type: list[str] = [
-            "int32",
-            "sbyte",
-            "uint16",
-            "uint32",
-            "bit&10",
-            "byte",
-            "int64",
-            "int16",
-            "Image",
-        ]
-        bool_type: list[str] = ["bit&", "bool"]
-        if type_name.startswith(tuple(int_type)):
+        res: Optional[str] = _TYPE_NAMES.get(type_name)
+        if res is not None:
+            return res
+        if type_name.startswith(_INT_TYPE_NAMES):
             return "int"
-        if type_name.startswith(tuple(bool_type)):
+        if type_name.startswith(_BOOL_TYPE_NAMES):
             return "bool"
         if type_name.startswith("str"):
             return "str"
@@ -765,14 +1091,14 @@ class Builder(Generic):
         if value.isdigit():
             return int(value)
 
-        if value.lower() in ["false", "true"]:
-            return value.lower() == "true"
+        # Only `true` and `false` can be a bool, so we can skip lowering anything longer.
+        if len(value) <= 5:
+            res: Optional[bool] = _BOOL_VALUES.get(value.lower())
+            if res is not None:
+                return res
 
-        if value.find(",") != -1:
-            test: str = value.replace(",", "")
-            if test.isdigit():
-                return [int(entry) for entry in value.split(",")]
-            return value
+        if "," in value and _INT_LIST_RE.fullmatch(value) is not None:
+            return [int(entry) for entry in value.split(",")]
         return value
 
     def to_typed_dict(self, class_name: str, keys: list[str], key_types: list[str]) -> str:
@@ -803,15 +1129,11 @@ class Builder(Generic):
         if len(keys) != len(key_types):
             msg = "The length of keys is not the same as key_types. | keys: %s | key_types: %s"
             raise ValueError(msg, len(keys), len(key_types))
-        temp: list[str] = []
-        temp.append(f"class {class_name}(TypedDict):")
-        for key, k_type in zip(keys, key_types, strict=False):
-            if len(key) == 0:
-                continue
-            # This only works on Item.csv as the `#` in the file is the actual item id.
-            _key = "id" if key == "#" else key
-            temp.append(f"    {_key}: {k_type}")
-        return "\n".join(temp)
+        # This only works on Item.csv as the `#` in the file is the actual item id.
+        return "\n".join([
+            f"class {class_name}(TypedDict):",
+            *(f"    {'id' if key == '#' else key}: {k_type}" for key, k_type in zip(keys, key_types, strict=False) if len(key) != 0),
+        ])
 
     def generate_enum(self, class_name: str, keys: list[int], values: list[str] | list[int]) -> str:
         """Takes in keys and values to generate an basic Enum.
@@ -833,11 +1155,10 @@ class Builder(Generic):
             A :class:`Enum` as a string.
 
         """
-        temp: list[str] = []
-        temp.append(f"class {class_name}(Enum):")
-        for key, key_value in zip(keys, values, strict=False):
-            temp.append(f"    {key_value} = {key}")
-        return "\n".join(temp)
+        return "\n".join([
+            f"class {class_name}(Enum):",
+            *(f"    {key_value} = {key}" for key, key_value in zip(keys, values, strict=False)),
+        ])
 
     # TODO(@k8thekat): - Better docstring.. explaniation is.. bad.
     async def to_enum(
@@ -889,8 +1210,7 @@ class Builder(Generic):
                 )
                 return
         elif url is not None:
-            res: bytes = await self._request(url=url)
-            self.write_data_to_file(path=DATA_PATH, file_name=file_name, data=res)
+            await self._download(url=url, path=DATA_PATH.joinpath(file_name))
             data = self.csv_parse(path=DATA_PATH.joinpath(file_name), convert_pound=False)
             keys: list[int] = []
             values: list[str] = []
@@ -917,21 +1237,53 @@ class Moogle(Generic):
 
     # This will eventually act like our cache to help reduce web requests for similar data.
     _angler_spot_cache: dict[str, AnglerFish]
-    _universalis: UniversalisAPI
+    # Only built once marketboard data is requested, see `<Moogle._universalis>`.
+    _universalis_api: Optional[UniversalisAPI]
     _angler: Angler
+    # Clients passed in by the caller are theirs to close, `<Moogle.clean_up()>` only closes the ones we created.
+    _owns_universalis: bool
+    _owns_angler: bool
 
     # FF14 Angler Integration
     _angler_loc_map: Optional[dict[str, int]]
     _angler_invert_loc_map: Optional[dict[int, str]]
     _angler_fish_map: Optional[dict[str, int]]
 
-    _items_cache: dict[str, Item]
+    # `item_id : Item`
+    _items_cache: dict[int, Item]
+    # The item ids matched by a name search, bounded to `_QUERY_CACHE_SIZE` entries. `(query, match, limit_results) : [item_id, ...]`
+    _query_cache: dict[tuple[str, int, int], list[int]]
+
+    # Many items share the same fishing spots, place names and gathering levels, so we build each of these once by ID.
+    _fishing_spots_cache: dict[int, FishingSpot]
+    _gathering_levels_cache: dict[int, GatheringItemLevel]
+    _place_names_cache: dict[int, PlaceName]
+    _spearfishing_spots_cache: dict[int, SpearFishingNotebook]
+
+    # Marketboard listings only change every so often, so repeat requests within `marketboard_ttl` seconds reuse the response.
+    # `(item_id, sorted request params) : (time.monotonic() of the request, CurrentData)`
+    _current_data_cache: dict[tuple[int, tuple[tuple[str, Any], ...]], tuple[float, CurrentData]]
+    # Requests still in flight under the same key, so concurrent callers share one round trip instead of each making their own.
+    _current_data_pending: dict[tuple[int, tuple[tuple[str, Any], ...]], asyncio.Task[CurrentData]]
+    marketboard_ttl: float
+
+    # Parallel arrays of `_items_ref` for scanning during partial matches.
+    # The names are stored pre-processed via `rapidfuzz.utils.default_process`, `_item_names[x]` belongs to `_item_ids[x]`.
+    _item_ids: list[int]
+    _item_names: list[str]
+    # Lowercased item name to item id, used for exact name lookups before any fuzzy matching.
+    _item_name_ids: dict[str, int]
+    # One lock per `_LAZY_TABLES` entry, so a table touched while `<Moogle.load_tables()>` is parsing it waits instead of parsing it again.
+    # - The `_LAZY_REFS` built from a table share its lock.
+    _table_locks: dict[str, threading.Lock]
 
     def __init__(
         self,
         session: Optional[aiohttp.ClientSession] = None,
         universalis: Optional[UniversalisAPI] = None,
         angler: Optional[Angler] = None,
+        *,
+        marketboard_ttl: float = 30.0,
     ) -> None:
         """Build your Moogle Intuition~.
 
@@ -943,18 +1295,40 @@ class Moogle(Generic):
             A pre-existing `<universalis.UniversalisAPI>` object if applicable, by default None.
         angler: :class:`Optional[Angler]`, optional
             A pre-existing `<ff14angler.Angler>` object if applicable, by default None.
+        marketboard_ttl: :class:`float`, optional
+            The number of seconds current marketboard data for an item is reused before requesting it again, by default 30.0.
+            - Set to `0` to always request fresh data.
 
         """
+        self.session = session
+        self.marketboard_ttl = marketboard_ttl
         self._builder = Builder(session=session)
+        self._universalis_api = universalis
+        self._owns_universalis = universalis is None
+        self._angler = Angler(session=session) if angler is None else angler
+        self._owns_angler = angler is None
 
-        if universalis is None:
-            self._universalis = UniversalisAPI(session=session)
-
-        if angler is None:
-            self._angler = Angler(session=session)
-
-        # Create our empty itemcache.
+        # Create our empty caches.
         self._items_cache = {}
+        self._query_cache = {}
+        self._fishing_spots_cache = {}
+        self._gathering_levels_cache = {}
+        self._place_names_cache = {}
+        self._spearfishing_spots_cache = {}
+        self._current_data_cache = {}
+        self._current_data_pending = {}
+        self._table_locks = {name: threading.Lock() for name in _LAZY_TABLES}
+
+    def __getattr__(self, name: str) -> Any:  # noqa: D105
+        # Only called when `name` has not been set yet; so each lazy table is loaded once and then stored on the instance.
+        # This runs synchronously on whatever thread touched the attribute, from a coroutine the first access blocks the event loop
+        # for a full JSON load. See `<Moogle.load_tables()>` to do it up front in threads.
+        if name in _LAZY_TABLES:
+            return self._load_table(name)
+        if name in _LAZY_REFS:
+            return self._load_ref(name)
+        msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+        raise AttributeError(msg)
 
     async def __aenter__(self) -> Self:  # noqa: D105
         try:
@@ -975,15 +1349,33 @@ class Moogle(Generic):
         await self.clean_up()
 
     async def clean_up(self) -> None:
-        """Handles deconstruction of `<Moogle>`."""
+        """Handles deconstruction of `<Moogle>`.
+
+        .. note::
+            A `<UniversalisAPI>` or `<Angler>` passed into `<Moogle>` is left open, as it belongs to the caller.
+
+        """
         LOGGER.debug("<%s._clean_up> | Closing any open `aiohttp.ClientSession`", __class__.__name__)
-        await self._universalis.clean_up()
+        if self._universalis_api is not None and self._owns_universalis:
+            await self._universalis_api.clean_up()
         await self._builder.clean_up()
-        await self._angler.clean_up()
+        if self._owns_angler:
+            await self._angler.clean_up()
+
+    @property
+    def _universalis(self) -> UniversalisAPI:
+        # Most lookups never touch the marketboard, so we only build the client when it is first needed.
+        if self._universalis_api is None:
+            self._universalis_api = UniversalisAPI(session=self.session)
+        return self._universalis_api
 
     async def build(self) -> Self:
         """Builds the required arrays and library's for `<Moogle>` to function.
 
+        .. note::
+            Only `item.json` is loaded here, the remaining tables are loaded the first time they are needed (eg. `Item.recipe`).
+            - That first access reads and parses the file on the event loop, await `<Moogle.load_tables()>` to load them in a thread.
+
         Returns
         -------
         :class:`Self`:
@@ -991,46 +1383,25 @@ class Moogle(Generic):
 
         """
         await self._builder.file_validation()
-        self._items: dict[str, DataTypeAliases] = self._load_json(path=DATA_PATH.joinpath("item.json"))
-
-        self._items_ref: dict[str | int, str | int] = self._reference_dict(data=self._items, value_get="name")
-
-        # Recipe related dict/JSON
-        self._recipes = self._load_json(path=DATA_PATH.joinpath("recipe.json"))
-        self._recipes_ref = self._reference_dict(data=self._recipes, value_get="item_result")
-        self._recipe_lookups = self._load_json(path=DATA_PATH.joinpath("recipe_lookup.json"))
+        self.clear_caches()
+        # Only the item table is needed to search for items, every other table is loaded on first access.
+        # See `<Moogle.__getattr__()>`; any tables from a previous build are dropped so they get reloaded.
+        for name in (*_LAZY_TABLES, *_LAZY_REFS):
+            self.__dict__.pop(name, None)
+        self._items = await asyncio.to_thread(self._load_json, path=DATA_PATH.joinpath("item.json"))
         # self._recipe_levels = self._load_json(path=DATA_PATH.joinpath("recipe_level.json"))
 
-        # Fishing related dict/JSON
-        self._fish_params: dict[str, DataTypeAliases] = self._load_json(path=DATA_PATH.joinpath("fish_parameter.json"))
-        # { item_id : dict ref id for `fish_parameter.json`}
-        self._fish_params_ref: dict[str | int, str | int] = self._reference_dict(
-            data=self._fish_params,
-            value_get="item",
-            flip_key_value=True,
-        )
-        self._fishing_spot: dict[str, DataTypeAliases] = self._load_json(path=DATA_PATH.joinpath("fishing_spot.json"))
-
-        # Spearfishing related dict/JSON
-        self._spearfishing_items: dict[str, DataTypeAliases] = self._load_json(path=DATA_PATH.joinpath("spearfishing_item.json"))
-        self._spearfishing_items_ref: dict[str | int, str | int] = self._reference_dict(
-            data=self._spearfishing_items,
-            value_get="item",
-            flip_key_value=True,
-        )
-        self._spearfishing_notebook: dict[str, DataTypeAliases] = self._load_json(path=DATA_PATH.joinpath("spearfishing_notebook.json"))
-
-        # Gathering related dict/JSON.
-        self._gathering_items: dict[str, DataTypeAliases] = self._load_json(path=DATA_PATH.joinpath("gathering_item.json"))
-        self._gathering_items_ref: dict[str | int, str | int] = self._reference_dict(
-            data=self._gathering_items,
-            value_get="item",
-            flip_key_value=True,
-        )
-        self._gathering_item_levels: dict[str, DataTypeAliases] = self._load_json(path=DATA_PATH.joinpath("gathering_item_level.json"))
-
-        # Location related JSON
-        self._place_names: dict[str, DataTypeAliases] = self._load_json(path=DATA_PATH.joinpath("place_name.json"))
+        self._items_ref = self._reference_dict(data=self._items, value_get="name")
+        self._item_ids = []
+        self._item_names = []
+        self._item_name_ids = {}
+        for key, value in self._items_ref.items():
+            if isinstance(key, int) and isinstance(value, str):
+                name: str = value.lower()
+                self._item_ids.append(key)
+                self._item_names.append(utils.default_process(value))
+                # Some names are shared by multiple ids, the first (lowest) id wins.
+                self._item_name_ids.setdefault(name, key)
 
         # FF14 Angler related dict.
         locs: tuple[dict[str, int], dict[int, str]] | None = await self._angler.get_location_id_mapping(include_inverted_map=True)
@@ -1041,7 +1412,45 @@ class Moogle(Generic):
 
         return self
 
-    def _load_json(self, path: Path, **json_args: Any) -> dict[str, DataTypeAliases]:
+    async def load_tables(self) -> None:
+        """Loads every table `<Moogle.build()>` otherwise leaves to be loaded on first access.
+
+        .. note::
+            The files are read and parsed concurrently in threads, along with the reference dicts built from them,
+            so the event loop isn't blocked by the first `Item.recipe`, `Item.fishing`, etc.
+            - A table touched while this is running waits for that thread rather than parsing the file a second time.
+
+        """
+        # Each table is parsed in its own thread, any table that is already loaded is simply returned.
+        await asyncio.gather(*[asyncio.to_thread(self._load_table, name) for name in _LAZY_TABLES])
+        # The reference dicts are built from the tables we just loaded, also off the event loop.
+        await asyncio.gather(*[asyncio.to_thread(self._load_ref, name) for name in _LAZY_REFS])
+
+    def _load_table(self, name: str) -> dict[int, DataTypeAliases]:
+        # Used by `<Moogle.__getattr__()>` and `<Moogle.load_tables()>`, loads one of the `_LAZY_TABLES` and stores it on the instance.
+        with self._table_locks[name]:
+            # Another thread may have finished loading the table while we waited on the lock.
+            value: Optional[dict[int, DataTypeAliases]] = self.__dict__.get(name)
+            if value is None:
+                LOGGER.debug("<%s.%s> | Loading table on first access. | Table: %s", __class__.__name__, "_load_table", name)
+                value = self._load_json(path=DATA_PATH.joinpath(_LAZY_TABLES[name] + ".json"))
+                setattr(self, name, value)
+        return value
+
+    def _load_ref(self, name: str) -> dict[str | int, str | int]:
+        # Used by `<Moogle.__getattr__()>` and `<Moogle.load_tables()>`, builds one of the `_LAZY_REFS` and stores it on the instance.
+        table, value_get, flip_key_value = _LAZY_REFS[name]
+        # Loaded before taking the lock, `<Moogle._load_table()>` takes the same lock and it is not re-entrant.
+        data: dict[int, DataTypeAliases] = getattr(self, table)
+        # A ref dict shares the lock of the table it is built from, so it is only built once.
+        with self._table_locks[table]:
+            value: Optional[dict[str | int, str | int]] = self.__dict__.get(name)
+            if value is None:
+                value = self._reference_dict(data=data, value_get=value_get, flip_key_value=flip_key_value)
+                setattr(self, name, value)
+        return value
+
+    def _load_json(self, path: Path, **json_args: Any) -> dict[int, DataTypeAliases]:
         if path.exists() is False:
             msg = "<%s.%s> | The Path provided does not exist. | Path: %s"
             raise FileNotFoundError(msg, __class__.__name__, "_load_json", path)
@@ -1049,26 +1458,30 @@ class Moogle(Generic):
             msg = "<%s.%s> | The Path provided is a directory. | Path: %s"
             raise TypeError(msg, __class__.__name__, path)
 
-        data: dict[str, DataTypeAliases] = json.loads(path.read_bytes(), **json_args)
-        return data
+        # `orjson` parses the raw bytes directly and is considerably faster, but it does not support any of the `json.loads()` kwargs.
+        # - We memory map the file so `orjson` can decode straight from the OS pages instead of a full `bytes` copy of the file.
+        if orjson is not None and len(json_args) == 0:
+            with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer, memoryview(buffer) as view:
+                data: dict[str, DataTypeAliases] = orjson.loads(view)
+        else:
+            data = json.loads(path.read_bytes(), **json_args)
+        # JSON object keys are always strings, our table keys are numeric ids so we convert them once here
+        # rather than calling `str()` on every lookup.
+        return {int(key): value for key, value in data.items()}
 
     def _reference_dict(
         self,
-        data: dict[str, DataTypeAliases],
+        data: dict[int, DataTypeAliases],
         value_get: str,
         *,
         flip_key_value: bool = False,
     ) -> dict[str | int, str | int]:
-        item_dict: dict[str | int, str | int] = {}
-        for key, value in data.items():
-            temp: Optional[str | int] = value.get(value_get, None)
-
-            if temp is None:
-                continue
-            if flip_key_value is True:
-                item_dict[temp] = key
-            else:
-                item_dict[key] = temp
+        item_dict: dict[str | int, str | int]
+        if flip_key_value is True:
+            # Values may not be unique (an item can have several gathering entries), the last entry in the table wins.
+            item_dict = {temp: key for key, value in data.items() if (temp := value.get(value_get)) is not None}
+        else:
+            item_dict = {key: temp for key, value in data.items() if (temp := value.get(value_get)) is not None}
 
         LOGGER.debug(
             "<%s.%s> | Value Get: %s | Number of Items: %s | Flip Key Value: %s",
@@ -1080,8 +1493,26 @@ class Moogle(Generic):
         )
         return item_dict
 
+    def clear_caches(self) -> None:
+        """Clears any cached :class:`Item` objects, shared lookup objects and name search results.
+
+        .. note::
+            Use this if the underlying data has been rebuilt.
+
+        """
+        LOGGER.debug("<%s.%s> | Clearing caches.", __class__.__name__, "clear_caches")
+        self._items_cache.clear()
+        self._query_cache.clear()
+        self._fishing_spots_cache.clear()
+        self._gathering_levels_cache.clear()
+        self._place_names_cache.clear()
+        self._spearfishing_spots_cache.clear()
+        self._current_data_cache.clear()
+        # Any request still in flight keeps running for the callers awaiting it, its response just isn't cached.
+        self._current_data_pending.clear()
+
     def _update_cache(self, item: Item) -> None:
-        self._items_cache.update({str(item.id): item})
+        self._items_cache[item.id] = item
 
     @overload
     def get_item(self, *, item: str, limit_results: Literal[1], match: int = ...) -> Item: ...
@@ -1116,86 +1547,111 @@ class Moogle(Generic):
         results: list[Item] = []
 
         # item: 10373 # magitek repair materials.
-        if item.isnumeric():
+        if item.isdecimal():
             # So let's try to check the cache first for a matching item assuming we have an `id` value.
-            cache: Optional[Item] = self._items_cache.get(item, None)
+            item_id = int(item)
+            cache: Optional[Item] = self._items_cache.get(item_id, None)
             if isinstance(cache, Item):
                 return cache
             # TODO(@k8thekat): If I type hint `res`, parts of the code become unreachable and I need to understand why.
-            res = self._items.get(item, None)
+            res = self._items.get(item_id, None)
             if res is not None and "level_item" in res:
-                cache = Item(data=res, moogle=self, universalis=self._universalis)
-                self._items_cache[item] = cache
+                cache = Item(data=res, moogle=self)
+                self._items_cache[item_id] = cache
                 return cache
             raise MoogleLookupError(item, "item", "get_item", self)
 
-        # item_name's we have to get a reference since we are supporting partial string matching.
-        # This handles the edge case of a perfect match, albeit unlikely.
-        ref: Optional[str | int] = self._items_ref.get(item, None)
+        # An exact (case insensitive) name match skips the fuzzy matching entirely.
+        ref: Optional[int] = self._item_name_ids.get(item.lower())
         if ref is not None:
-            res = self._items.get(str(ref), None)
-            if res is not None and "item_level" in res:
-                cache = Item(data=res, moogle=self, universalis=self._universalis)
-                self._items_cache[item] = cache
-                return cache
+            cache = self._items_cache.get(ref, None)
+            if cache is None:
+                res = self._items.get(ref, None)
+                if res is not None and "level_item" in res:
+                    cache = Item(data=res, moogle=self)
+                    self._items_cache[ref] = cache
+            if cache is not None:
+                if limit_results == 1:
+                    return cache
+                # The exact match leads the results, the partial matches below still fill out the rest.
+                results.append(cache)
 
         # if the item_name wasn't in the ref list we would do our partial matching below.
         # we take our list of item_ids that partially matched and get our data/objects.
-        matches = self._partial_match(item, match=match)
+        # Repeated name searches skip the fuzzy scan entirely, the key uses the same processing as our query.
+        query_key: tuple[str, int, int] = (utils.default_process(item), match, limit_results)
+        # Popping and re-inserting a hit moves it to the end, so the first key is always the least recently used entry.
+        matches: Optional[list[int]] = self._query_cache.pop(query_key, None)
+        if matches is None:
+            try:
+                # We fetch every match above the cutoff, as rows without a `level_item` and our exact match are skipped below
+                # and would otherwise use up slots of `limit_results`.
+                candidates: list[int] = self._partial_match(item, match=match)
+            except MoogleLookupError:
+                if len(results) == 0:
+                    raise
+                candidates = []
+            matches = []
+            for entry in candidates:
+                # If we don't find it, we will skip it.. :shrug:
+                res = self._items.get(entry, None)
+                if res is None or "level_item" not in res:
+                    continue
+                matches.append(entry)
+                # We keep one spare id, as the exact match of a query (see `ref`) is skipped below and may be one of them.
+                # - Queries that share a key can have a different exact match (eg. "iron-ore" and "Iron Ore"), so it isn't cached.
+                if len(matches) > limit_results:
+                    break
+            if len(self._query_cache) >= _QUERY_CACHE_SIZE:
+                del self._query_cache[next(iter(self._query_cache))]
+        self._query_cache[query_key] = matches
         LOGGER.debug("<%s.%s> | Searching... %s partial matches.", __class__.__name__, "get_item", len(matches))
+        # Checked once up front rather than per match, a fuzzy search can return a lot of entries.
+        debug: bool = LOGGER.isEnabledFor(logging.DEBUG)
         for entry in matches:
+            # Our exact match is already in the results.
+            if entry == ref:
+                continue
             # Let's try to find our partial matches in our cache too.
             cache = self._items_cache.get(entry, None)
-            LOGGER.debug("<%s.%s> | Checking item cache.. | item: %s", __class__.__name__, "get_item", entry)
-            if cache is not None:
+            if debug:
+                LOGGER.debug("<%s.%s> | Checking item cache.. | item: %s", __class__.__name__, "get_item", entry)
+            if cache is None:
+                # Not in cache; so let's build it from our array of data.
+                res = self._items.get(entry, None)
+                # `matches` only holds entries with a `level_item`, this narrows `res` to `ItemData`.
+                if res is None or "level_item" not in res:
+                    continue
+                if debug:
+                    LOGGER.debug("<%s.%s> | Found item, building data. | item: %s", __class__.__name__, "get_item", entry)
+                cache = Item(data=res, moogle=self)
+                # Cache by the item id so repeat lookups by id or by another partial match hit the cache.
+                self._items_cache[entry] = cache
+            elif debug:
                 LOGGER.debug("<%s.%s> | Found item in cache.. | item: %s", __class__.__name__, "get_item", entry)
-                results.append(cache)
-                continue
-            # Not in cache; so let's get them from our array of data.
-            # If we don't find it, we will skip it.. :shrug:
-
-            res = self._items.get(entry, None)
-            if res is not None and "level_item" in res:
-                LOGGER.debug("<%s.%s> | Found item, building data. | item: %s", __class__.__name__, "get_item", entry)
-                cache = Item(data=res, moogle=self, universalis=self._universalis)
-                self._items_cache[item] = cache
-                results.append(cache)
+            results.append(cache)
 
         if len(results) == 0:
             raise MoogleLookupError(item, "item", "get_item", self)
 
         return results[0] if limit_results == 1 else results[:limit_results]
 
-    def _partial_match(self, query: str, match: int = 80) -> list[str]:
+    def _partial_match(self, query: str, match: int = 80) -> list[int]:
         # This section assumes we are using `item_name` given the above if check for `item_id`.
         # matches will be a list of "item_id's" that matched our query string.
-        matches: list[str] = []
-        for key, value in self._items_ref.items():  # { item_id : item_name }
-            LOGGER.debug(
-                "Searching... key: %s | value: %s | query: %s",
-                key,
-                value,
-                query,
-            )
-
-            _value = str(value) if isinstance(value, int) else value
-
-            ratio: int = fuzz.partial_ratio(s1=_value.lower(), s2=query.lower())  # pyright: ignore[reportUnknownMemberType]
-
-            # We have a partial match, but not exact. So we can either
-            # look the item up and see if we can find it, or return the key.
-            if ratio >= match:
-                LOGGER.debug(
-                    "<%s.%s> | Searching... | key: %s | value: %s | ratio: %s | query: %s ",
-                    __class__.__name__,
-                    "_partial_match",
-                    key,
-                    _value,
-                    ratio,
-                    query,
-                )
-                matches.append(str(key))
-                continue
+        # The scorer is run over every name inside rapidfuzz, which hands back the best scoring `(name, score, index)` entries
+        # at or above `match`, sorted by score. `limit=None` returns every entry above the cutoff, `<Moogle.get_item()>` filters them.
+        # The names were pre-processed in `build()`, so only our query needs processing.
+        needle: str = utils.default_process(query)
+        results: list[tuple[str, float, int]] = process.extract(
+            needle,
+            self._item_names,
+            scorer=fuzz.partial_ratio,
+            processor=None,
+            score_cutoff=match,
+            limit=None,
+        )
+        matches: list[int] = [self._item_ids[index] for _, _, index in results]
 
         if len(matches) == 0:
             raise MoogleLookupError(query, "query", "_partial_match", self)
@@ -1203,127 +1659,98 @@ class Moogle(Generic):
         return matches
 
     def _get_item_job_recipes(self, item_id: int) -> JobRecipe:
-        LOGGER.debug(
-            "<%s.%s> | Searching... Job Recipe by Item ID: %s | Entries: %s",
-            __class__.__name__,
-            "get_item_job_recipes",
-            item_id,
-            len(self._recipe_lookups),
-        )
-        data: Optional[DataTypeAliases] = self._recipe_lookups.get(str(item_id), None)
+        LOGGER.debug("<%s.%s> | Searching... Job Recipe by Item ID: %s", __class__.__name__, "get_item_job_recipes", item_id)
+        data: Optional[DataTypeAliases] = self._recipe_lookups.get(item_id, None)
         if data is None or "CRP" not in data:
             raise MoogleLookupError(str(item_id), "item_id", "get_item_job_recipes", self)
 
         return JobRecipe(data=data, moogle=self)
 
-    def _get_recipe(self, recipe_id: str) -> Recipe:
-        # I am storing str "Recipe ID" : int "Item Result ID"
-        LOGGER.debug("<%s.%s> | Searching... recipe_id: %s | entries: %s", __class__.__name__, "_get_recipe", recipe_id, len(self._recipes))
+    def _get_recipe(self, recipe_id: int) -> Recipe:
+        LOGGER.debug("<%s.%s> | Searching... recipe_id: %s", __class__.__name__, "_get_recipe", recipe_id)
         data: Optional[DataTypeAliases] = self._recipes.get(recipe_id, None)
         if data is None or "item_result" not in data:
-            raise MoogleLookupError(recipe_id, "recipe_id", "_get_recipe", self)
+            raise MoogleLookupError(str(recipe_id), "recipe_id", "_get_recipe", self)
         return Recipe(data=data, moogle=self)
 
     def _get_gathering_level(self, level_id: int) -> GatheringItemLevel:
-        LOGGER.debug(
-            "<%s.%s> | Searching... gathering_level_id: %s | entries: %s",
-            __class__.__name__,
-            "_get_gathering_level",
-            level_id,
-            len(self._gathering_item_levels),
-        )
-        data: Optional[DataTypeAliases] = self._gathering_item_levels.get(str(level_id), None)
+        LOGGER.debug("<%s.%s> | Searching... gathering_level_id: %s", __class__.__name__, "_get_gathering_level", level_id)
+        cached: Optional[GatheringItemLevel] = self._gathering_levels_cache.get(level_id)
+        if cached is not None:
+            return cached
+        data: Optional[DataTypeAliases] = self._gathering_item_levels.get(level_id, None)
         # TODO(@k8thekat): - In theory all 3 dict key values are present to build GatheringItemLevel object.
         # so I am unsure WHAT or Why it's complaining.
         if data is None or ("id" not in data and "stars" not in data and "gathering_item_level" not in data):
             raise MoogleLookupError(str(level_id), "level_id", "_get_gathering_level", self)
-        return GatheringItemLevel(data=data, moogle=self)
+        cached = GatheringItemLevel(data=data, moogle=self)
+        self._gathering_levels_cache[level_id] = cached
+        return cached
 
     def _get_fishing_spot(self, spot_id: int) -> FishingSpot:
-        LOGGER.debug(
-            "<%s.%s> | Searching... spot_id: %s | entries: %s",
-            __class__.__name__,
-            "_get_fishing_spot",
-            spot_id,
-            len(self._fishing_spot),
-        )
-        data: Optional[DataTypeAliases] = self._fishing_spot.get(str(spot_id), None)
+        LOGGER.debug("<%s.%s> | Searching... spot_id: %s", __class__.__name__, "_get_fishing_spot", spot_id)
+        cached: Optional[FishingSpot] = self._fishing_spots_cache.get(spot_id)
+        if cached is not None:
+            return cached
+        data: Optional[DataTypeAliases] = self._fishing_spot.get(spot_id, None)
         if data is None or "fishing_spot_category" not in data:
             raise MoogleLookupError(str(spot_id), "spot_id", "_get_fishing_spot", self)
-        return FishingSpot(data=data, moogle=self)
+        cached = FishingSpot(data=data, moogle=self)
+        self._fishing_spots_cache[spot_id] = cached
+        return cached
 
     def _get_spearfishing_spot(self, record_type: int) -> SpearFishingNotebook:
-        LOGGER.debug(
-            "<%s.%s> | Searching... record_type: %s | entries: %s",
-            __class__.__name__,
-            "_get_spearfishing_spot",
-            record_type,
-            len(self._spearfishing_notebook),
-        )
-        data: Optional[DataTypeAliases] = self._spearfishing_notebook.get(str(record_type), None)
+        LOGGER.debug("<%s.%s> | Searching... record_type: %s", __class__.__name__, "_get_spearfishing_spot", record_type)
+        cached: Optional[SpearFishingNotebook] = self._spearfishing_spots_cache.get(record_type)
+        if cached is not None:
+            return cached
+        data: Optional[DataTypeAliases] = self._spearfishing_notebook.get(record_type, None)
         if data is None or "territory_type" not in data:
             raise MoogleLookupError(str(record_type), "record_type", "_get_spearfishing_spot", self)
-        return SpearFishingNotebook(data=data, angler=self._angler, moogle=self)
+        cached = SpearFishingNotebook(data=data, angler=self._angler, moogle=self)
+        self._spearfishing_spots_cache[record_type] = cached
+        return cached
 
     def _get_place_name(self, place_id: int) -> PlaceName:
-        LOGGER.debug(
-            "<%s.%s> | Searching... place_id: %s | entries: %s",
-            __class__.__name__,
-            "_get_place_name",
-            place_id,
-            len(self._place_names),
-        )
-        data: Optional[DataTypeAliases] = self._place_names.get(str(place_id), None)
+        LOGGER.debug("<%s.%s> | Searching... place_id: %s", __class__.__name__, "_get_place_name", place_id)
+        cached: Optional[PlaceName] = self._place_names_cache.get(place_id)
+        if cached is not None:
+            return cached
+        data: Optional[DataTypeAliases] = self._place_names.get(place_id, None)
         if data is None or "name_no_article" not in data:
             raise MoogleLookupError(str(place_id), "place_id", "_get_place_name", self)
-        return PlaceName(data=data, moogle=self)
+        cached = PlaceName(data=data, moogle=self)
+        self._place_names_cache[place_id] = cached
+        return cached
 
     def _is_fishable(self, item_id: int) -> Fishing:
-        LOGGER.debug(
-            "<%s.%s> | Searching... item_id: %s | entries: %s ",
-            __class__.__name__,
-            "_is_fishable",
-            item_id,
-            len(self._fish_params_ref),
-        )
+        LOGGER.debug("<%s.%s> | Searching... item_id: %s", __class__.__name__, "_is_fishable", item_id)
 
         key: Optional[str | int] = self._fish_params_ref.get(item_id, None)
         if key is None:
             raise MoogleLookupError(str(item_id), "item_id", "_is_fishable", self)
 
-        data: Optional[DataTypeAliases] = self._fish_params.get(str(key), None)
+        data: Optional[DataTypeAliases] = self._fish_params.get(int(key), None)
         if data is None or "fishing_spot" not in data:
             raise MoogleLookupError(str(key), "item_id", "_is_fishable", self)
         return Fishing(data=data, angler=self._angler, moogle=self)
 
     def _is_spearfishing(self, item_id: int) -> SpearFishing:
-        LOGGER.debug(
-            "<%s.%s> | Searching... item_id: %s | entries: %s ",
-            __class__.__name__,
-            "_is_spearfishing",
-            item_id,
-            len(self._spearfishing_items_ref),
-        )
+        LOGGER.debug("<%s.%s> | Searching... item_id: %s", __class__.__name__, "_is_spearfishing", item_id)
         key: Optional[str | int] = self._spearfishing_items_ref.get(item_id, None)
         if key is None:
             raise MoogleLookupError(str(item_id), "item_id", "_is_spearfishing", self)
-        data: Optional[DataTypeAliases] = self._spearfishing_items.get(str(key), None)
+        data: Optional[DataTypeAliases] = self._spearfishing_items.get(int(key), None)
         if data is None or "is_visible" not in data:
             raise MoogleLookupError(str(key), "item_id", "_is_spearfishing", self)
         return SpearFishing(data=data, angler=self._angler, moogle=self)
 
     def _is_gatherable(self, item_id: int) -> GatheringItem:
-        LOGGER.debug(
-            "<%s.%s> | Searching... item_id: %s | entries: %s ",
-            __class__.__name__,
-            "_is_gatherable",
-            item_id,
-            len(self._gathering_items_ref),
-        )
+        LOGGER.debug("<%s.%s> | Searching... item_id: %s", __class__.__name__, "_is_gatherable", item_id)
         key: Optional[str | int] = self._gathering_items_ref.get(item_id, None)
         if key is None:
             raise MoogleLookupError(str(item_id), "item_id", "_is_gatherable", self)
-        data: Optional[DataTypeAliases] = self._gathering_items.get(str(key), None)
+        data: Optional[DataTypeAliases] = self._gathering_items.get(int(key), None)
 
         # TODO(@k8thekat): - In theory the key values are present to build GatheringItem object.
         # so I am unsure WHAT or Why it's complaining.
@@ -1376,6 +1803,42 @@ class Moogle(Generic):
         )
         return await self._universalis.get_bulk_current_data(items=query, **kwargs)
 
+    async def _get_current_data(self, item_id: int, **kwargs: Unpack[CurMarketBoardParams]) -> CurrentData:
+        key: tuple[int, tuple[tuple[str, Any], ...]] = (item_id, tuple(sorted(kwargs.items())))
+        cached: Optional[tuple[float, CurrentData]] = self._current_data_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.marketboard_ttl:
+            LOGGER.debug("<%s.%s> | Using cached marketboard data. | item_id: %s", __class__.__name__, "_get_current_data", item_id)
+            return cached[1]
+
+        pending: Optional[asyncio.Task[CurrentData]] = self._current_data_pending.get(key)
+        if pending is not None:
+            LOGGER.debug("<%s.%s> | Joining in-flight marketboard request. | item_id: %s", __class__.__name__, "_get_current_data", item_id)
+            # Shielded so one caller being cancelled does not cancel the request for everyone else waiting on it.
+            return await asyncio.shield(pending)
+
+        task: asyncio.Task[CurrentData] = asyncio.create_task(self._universalis.get_current_data(item=item_id, **kwargs))
+        self._current_data_pending[key] = task
+        # The task stores its own result, so the response is still cached if this caller is cancelled while waiting on it.
+        task.add_done_callback(functools.partial(self._current_data_done, key))
+        return await asyncio.shield(task)
+
+    def _current_data_done(self, key: tuple[int, tuple[tuple[str, Any], ...]], task: asyncio.Task[CurrentData]) -> None:
+        # Done callback of the requests made by `<Moogle._get_current_data()>`.
+        # Retrieving the exception marks it as handled, any waiting callers still receive it through their `await`.
+        failed: bool = task.cancelled() or task.exception() is not None
+        # The entry is gone if `<Moogle.clear_caches()>` was called while the request was in flight, so its response is not cached.
+        if self._current_data_pending.get(key) is not task:
+            return
+        del self._current_data_pending[key]
+        # With a `marketboard_ttl` of 0 or less every request is fresh, so there is no point holding onto the response.
+        if failed or self.marketboard_ttl <= 0:
+            return
+        # Re-inserting moves the key to the end, so the first key is always the oldest entry.
+        self._current_data_cache.pop(key, None)
+        if len(self._current_data_cache) >= _MARKETBOARD_CACHE_SIZE:
+            del self._current_data_cache[next(iter(self._current_data_cache))]
+        self._current_data_cache[key] = (time.monotonic(), task.result())
+
     async def get_history_marketboard(
         self,
         items: str | list[Item | str],
@@ -1424,8 +1887,8 @@ class Moogle(Generic):
         self,
         data: bytes | str,
         *,
-        omit_item_names: Optional[list[str]] = None,
-        omit_inv_locs: Optional[list[InventoryLocation]] = None,
+        omit_item_names: Optional[Collection[str]] = None,
+        omit_inv_locs: Optional[Collection[InventoryLocation]] = None,
     ) -> list[InventoryItem]:
         r"""Parse a Allagon Tools Inventory CSV.
 
@@ -1436,10 +1899,10 @@ class Moogle(Generic):
         ----------
         data: :class:`bytes | str `
             The source of the CSV file data. This assumes the data structure of the CSV file is using `\n` as a seperator for rows.
-        omit_inv_locs: :class:`Optional[list[InventoryLocationEnum]]`, optional
+        omit_inv_locs: :class:`Optional[Collection[InventoryLocationEnum]]`, optional
             The inventory location of the item to omit from our returned list, by default is None.
             - If `None`, will use the global `ATOOLS_OMIT_INV_LOCS`.
-        omit_item_names: :class:`Optional[list[str]]`, optional
+        omit_item_names: :class:`Optional[Collection[str]]`, optional
             Any item names to omit such as `Free Company Credits` as it's not apart of the XIV Item.json, by default [].
             - If `None`, will use the global `ATOOLS_OMIT_ITEM_NAMES`.
 
@@ -1448,49 +1911,90 @@ class Moogle(Generic):
         :class:`list[FFXIVInventoryItem]`
             Returns a list of converted CSV data into FFXIVInventoryItem.
 
+        Raises
+        ------
+        ValueError
+            If the CSV header is missing any of the columns we read.
+
         """
         if isinstance(data, bytes):
             data = data.decode(encoding="utf-8")
-        keys = data.split("\n")[0]
-        file = data
 
+        # Both are checked for every row, so we make sure we are using a hashed set for membership checks.
+        # - The globals stay lists so they can still be appended to, they are converted here on every call.
         if omit_inv_locs is None:
             omit_inv_locs = ATOOLS_OMIT_INV_LOCS
+        omit_locs: frozenset[InventoryLocation] = frozenset(omit_inv_locs)
 
         if omit_item_names is None:
             omit_item_names = ATOOLS_OMIT_ITEM_NAMES
+        omit_names: frozenset[str] = frozenset(name.lower() for name in omit_item_names)
+
+        reader: Iterator[list[str]] = csv.reader(StringIO(data))
+        header: Optional[list[str]] = next(reader, None)
+        if header is None:
+            return []
 
         # Keys= "Favorite?", "Icon", "Name", "Type", "Total Quantity Available", "Source", "Inventory Location"
-        # We know the structure of res to be Iterator[AllagonToolsInventoryCSV].
-        _keys: list[str] = keys.strip().replace("?", "").lower().replace(" ", "_").split(",")
-        res: Iterator[AllagonToolsInventoryCSV] = csv.DictReader(file, fieldnames=_keys)  # type: ignore[reportAssignmentType]
+        # We only need a handful of the columns, so we resolve their positions once and index each row directly.
+        _keys: list[str] = [key.strip().replace("?", "").lower().replace(" ", "_") for key in header]
+        try:
+            favourite_idx: int = _keys.index("favorite")
+            name_idx: int = _keys.index("name")
+            type_idx: int = _keys.index("type")
+            quantity_idx: int = _keys.index("total_quantity_available")
+            source_idx: int = _keys.index("source")
+            location_idx: int = _keys.index("inventory_location")
+        except ValueError:
+            missing: list[str] = [key for key in _ATOOLS_CSV_KEYS if key not in _keys]
+            LOGGER.error(  # noqa: TRY400
+                "<%s.%s> | Missing CSV header(s). | missing: %s | keys: %s",
+                __class__.__name__,
+                "_parse_atools_csv",
+                missing,
+                _keys,
+            )
+            msg = f"The Allagon Tools CSV is missing the expected header(s): {', '.join(missing)}"
+            raise ValueError(msg) from None
         LOGGER.debug(
             "<%s.%s> | Reading CSV data. | keys: %s | data size: %s",
             __class__.__name__,
             "_parse_atools_csv",
             _keys,
-            len(file),
+            len(data),
         )
         inventory: list[InventoryItem] = []
-        for entry in res:
-            if entry["name"].lower().startswith("free company credits") or entry["name"].lower() in omit_item_names:
-                LOGGER.debug("<%s.%s> | Skipping entry. | entry: %s", __class__.__name__, "_parse_atools_csv", entry["name"])
+        for row in reader:
+            if len(row) < len(_keys):
+                LOGGER.warning("<%s.%s> | Skipping short row. | row: %s", __class__.__name__, "_parse_atools_csv", row)
+                continue
+            name: str = row[name_idx]
+            lowered: str = name.lower()
+            if lowered.startswith("free company credits") or lowered in omit_names:
+                LOGGER.debug("<%s.%s> | Skipping entry. | entry: %s", __class__.__name__, "_parse_atools_csv", name)
                 continue
             # Given we are using item names; there is a "small" chance it will return incorrect items
             # but it should find everything as it's directly from the game.
             try:
-                item_id: Item = self.get_item(item=entry["name"], limit_results=1, match=95)
+                item_id: Item = self.get_item(item=name, limit_results=1, match=95)
             except MoogleLookupError:
-                LOGGER.warning("<%s.%s> | Failed to lookup item name. | item: %s", __class__.__name__, "_parse_atools_csv", entry["name"])
+                LOGGER.warning("<%s.%s> | Failed to lookup item name. | item: %s", __class__.__name__, "_parse_atools_csv", name)
                 continue
 
+            quantity: str = row[quantity_idx]
+            entry: AllagonToolsInventoryCSV = {
+                "favourite": _BOOL_VALUES.get(row[favourite_idx].strip().lower(), False),
+                "name": name,
+                "type": row[type_idx],
+                "total_quantity_available": int(quantity) if quantity.isdigit() else 0,
+                "source": row[source_idx],
+                "inventory_location": row[location_idx],
+            }
             item = InventoryItem(item_id=item_id.id, data=entry)
             # If we have inventory locations to omit and our item is NOT in that list of locations, lets add it to our results.
-            if item.location not in omit_inv_locs:
+            if item.location not in omit_locs:
                 inventory.append(item)
 
-        if isinstance(file, TextIOWrapper):
-            file.close()
         return inventory
 
 
@@ -1582,7 +2086,17 @@ class Item(Object):
     is_advanced_melding_permitted: bool
     is_glamourous: bool
 
+    _enum_keys: ClassVar[dict[str, type[Enum]]] = {"equip_slot_category": EquipSlotCategory}
+
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = ("id", "name")
+
     __slots__ = (
+        "_fishing",
+        "_gathering",
+        "_mb_current",
+        "_mb_history",
+        "_recipe",
+        "_spear_fishing",
         "always_collectable",
         "can_be_hq",
         "description",
@@ -1614,54 +2128,35 @@ class Item(Object):
 
         """
         super().__init__(data=data, moogle=kwargs["moogle"])
-        # This list to control the amount of information we return via `__str__()` and `__repr__()` dunder methods.
-        self._repr_keys = ["id", "name"]
+        # Set up front so the `mb_current` and `mb_history` properties are plain reads.
+        self._mb_current = None
+        self._mb_history = None
         for key in self.__slots__:
             value: Optional[int | bool | str] = data.get(key, None)
             if value is None:
                 continue
-            if key == "equip_slot_category" and isinstance(value, int):
-                try:
-                    self.equip_slot_category = EquipSlotCategory(value=value)
-                except ValueError:
-                    LOGGER.warning(
-                        "<%s> | Failed to find value in %s. | value: %s ",
-                        __class__.__name__,
-                        "EquipSlotCategory",
-                        value,
-                    )
-                    self.equip_slot_category = None
-
+            if key in self._enum_keys and isinstance(value, int):
+                setattr(self, key, self._to_enum(key, value))
             else:
                 setattr(self, key, value)
-        try:
-            self._gathering = self._moogle._is_gatherable(self.id)
-        except MoogleLookupError:
-            self._gathering = None
-        try:
-            self._recipe = self._moogle._get_item_job_recipes(self.id)
-        except MoogleLookupError:
-            self._recipe = None
-        try:
-            self._fishing = self._moogle._is_fishable(self.id)
-        except MoogleLookupError:
-            self._fishing = None
-        try:
-            self._spear_fishing = self._moogle._is_spearfishing(self.id)
-        except MoogleLookupError:
-            self._spear_fishing = None
+        # The `recipe`, `fishing`, `spear_fishing` and `gathering` lookups are only needed by a few items,
+        # so they are resolved the first time the related property is accessed.
 
     def __len__(self) -> int:  # noqa: D105
-        return len(str(self.id))
+        return bisect.bisect_right(_POWERS_OF_TEN, self.id) + 1
 
-    def __eq__(self, other: object) -> bool:  # noqa: D105
-        return isinstance(other, self.__class__) and self.id == other.id
+    def __eq__(self, other: object) -> bool | NotImplementedType:  # noqa: D105
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id  # pyright: ignore[reportAttributeAccessIssue]
 
     def __hash__(self) -> int:  # noqa: D105
         return hash(self.id)
 
-    def __lt__(self, other: object) -> bool:  # noqa: D105
-        return isinstance(other, self.__class__) and self.id < other.id
+    def __lt__(self, other: object) -> bool | NotImplementedType:  # noqa: D105
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id < other.id  # pyright: ignore[reportAttributeAccessIssue]
 
     @property
     def recipe(self) -> Optional[JobRecipe]:
@@ -1673,6 +2168,14 @@ class Item(Object):
             Returns any related recipe information as an object representing the data from recipe.json.
 
         """
+        try:
+            return self._recipe
+        except AttributeError:
+            pass
+        try:
+            self._recipe = self._moogle._get_item_job_recipes(self.id)
+        except MoogleLookupError:
+            self._recipe = None
         return self._recipe
 
     @property
@@ -1685,6 +2188,14 @@ class Item(Object):
             Returns any related fishing information as an object representing the data from fishing_spot.json.
 
         """
+        try:
+            return self._fishing
+        except AttributeError:
+            pass
+        try:
+            self._fishing = self._moogle._is_fishable(self.id)
+        except MoogleLookupError:
+            self._fishing = None
         return self._fishing
 
     @property
@@ -1697,6 +2208,14 @@ class Item(Object):
             Returns any related spear fishing information as an object representing the data from spearfishing_item.json.
 
         """
+        try:
+            return self._spear_fishing
+        except AttributeError:
+            pass
+        try:
+            self._spear_fishing = self._moogle._is_spearfishing(self.id)
+        except MoogleLookupError:
+            self._spear_fishing = None
         return self._spear_fishing
 
     @property
@@ -1709,6 +2228,14 @@ class Item(Object):
             Returns any related gathering information as an object representing the data from gathering_item.json.
 
         """
+        try:
+            return self._gathering
+        except AttributeError:
+            pass
+        try:
+            self._gathering = self._moogle._is_gatherable(self.id)
+        except MoogleLookupError:
+            self._gathering = None
         return self._gathering
 
     @property
@@ -1724,22 +2251,20 @@ class Item(Object):
     @property
     def mb_current(self) -> Optional[CurrentData]:
         """Cached current marketboard data, if applicable."""
-        try:
-            return self._mb_current
-        except AttributeError:
-            return None
+        return self._mb_current
 
     @property
     def mb_history(self) -> Optional[HistoryData]:
         """Cached history marketboard data, if applicable."""
-        try:
-            return self._mb_history
-        except AttributeError:
-            return None
+        return self._mb_history
 
     async def get_current_marketboard(self, **kwargs: Unpack[CurMarketBoardParams]) -> CurrentData:
         """Retrieve the current Marketboard data for this item, while also setting the `<Item.mb_current>` property.
 
+        .. note::
+            Repeat requests with the same parameters within `<Moogle.marketboard_ttl>` seconds reuse the previous response.
+            - That :class:`CurrentData` object is shared with every other caller requesting the same item, treat it as read-only.
+
         Parameters
         ----------
         **kwargs: :class:`Unpack[MarketBoardParams]`
@@ -1751,7 +2276,7 @@ class Item(Object):
             The JSON response converted into a :class:`CurrentData` object.
 
         """
-        self._mb_current = await self._moogle._universalis.get_current_data(item=self.id, **kwargs)
+        self._mb_current = await self._moogle._get_current_data(self.id, **kwargs)
         return self._mb_current
 
     async def get_history_marketboard(self, **kwargs: Unpack[HistMarketBoardParams]) -> HistoryData:
@@ -1834,7 +2359,7 @@ class JobRecipe(Object):
                 continue
             if isinstance(value, int) and value != 0:
                 # This takes the value data and builds our FFXIVRecipe class from the raw JSON stored on our Moogle class.
-                setattr(self, key, self._moogle._get_recipe(str(value)))
+                setattr(self, key, self._moogle._get_recipe(value))
 
 
 class Recipe(Object):
@@ -1899,6 +2424,11 @@ class Recipe(Object):
     is_expert: :class:`bool`
         If the recipe is an expert craft or not.
 
+    Properties
+    ----------
+    ingredients: :class:`list[tuple[int, int]]`
+        The `(item id, amount)` of every ingredient the recipe uses.
+
     """
 
     craft_type: Optional[CraftType]
@@ -1928,6 +2458,18 @@ class Recipe(Object):
     is_specialization_required: int
     is_expert: bool
 
+    _enum_keys: ClassVar[dict[str, type[Enum]]] = {"craft_type": CraftType}
+
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = (
+        "craft_type",
+        "item_result",
+        "is_expert",
+        "item_required",
+        "amount_result",
+        *(f"item_ingredient{idx}" for idx in range(8)),
+        *(f"amount_ingredient{idx}" for idx in range(8)),
+    )
+
     __slots__ = (
         "amount_ingredient0",
         "amount_ingredient1",
@@ -1970,44 +2512,38 @@ class Recipe(Object):
 
         """
         super().__init__(data=data, moogle=kwargs["moogle"])
-        # This list to control the amount of information we return via `__str__()` and `__repr__()` dunder methods.
-        self._repr_keys = ["craft_type", "item_result", "is_expert", "item_required", "amount_result"]
-        self._repr_keys.extend([f"item_ingredient{idx}" for idx in range(8)])
-        self._repr_keys.extend([f"amount_ingredient{idx}" for idx in range(8)])
         for key in self.__slots__:
-            value: Optional[int | bool | str] = data.get(key, None)
+            value: Optional[int | bool | str | Enum] = data.get(key, None)
             if value is None:
                 continue
+            # Only the enum and bool keys need converting, every other value (including the item ids) is kept as is.
             if isinstance(value, int):
-                if (
-                    key in ["is_specialization_required", "item_result", "item_required"] or key.startswith("item_ingredient")
-                ) and value != 0:
-                    setattr(self, key, value)
-                    # try:
-                    #     setattr(self, key, self._moogle.get_item(item=str(value), limit_results=1))
-                    # except MoogleLookupError:
-                    #     LOGGER.warning("<%s> | Failed to find item. | item: %s", __class__.__name__, value)
-                    #     setattr(self, key, value)
-
-                elif key == "craft_type":
-                    try:
-                        self.craft_type = CraftType(value=value)
-                    except ValueError:
-                        LOGGER.warning(
-                            "<%s> | Failed to find value in %s. | value: %s ",
-                            __class__.__name__,
-                            "CraftType",
-                            value,
-                        )
-                        self.craft_type = None
-
-                elif key in ["is_expert", "can_hq", "can_quick_synth"]:
-                    setattr(self, key, bool(value))
-                else:
-                    setattr(self, key, value)
+                if key in self._enum_keys:
+                    value = self._to_enum(key, value)
+                elif key in _RECIPE_BOOL_KEYS:
+                    value = bool(value)
+                # elif key.startswith("item_") and value != 0:
+                #     try:
+                #         value = self._moogle.get_item(item=str(value), limit_results=1)
+                #     except MoogleLookupError:
+                #         LOGGER.warning("<%s> | Failed to find item. | item: %s", __class__.__name__, value)
+            setattr(self, key, value)
 
-            else:
-                setattr(self, key, value)
+    @property
+    def ingredients(self) -> list[tuple[int, int]]:
+        """The `(item id, amount)` of every ingredient the recipe uses, unused ingredient slots are skipped.
+
+        Returns
+        -------
+        :class:`list[tuple[int, int]]`
+            The `item_ingredientX` and `amount_ingredientX` pairs in order.
+
+        """
+        return [
+            (item_id, getattr(self, amount_key, 0))
+            for item_key, amount_key in _RECIPE_INGREDIENT_KEYS
+            if (item_id := getattr(self, item_key, 0)) != 0
+        ]
 
 
 class ItemFish(Object):
@@ -2045,6 +2581,8 @@ class ItemFish(Object):
     _angler_data: Optional[list[AnglerFish]]
     _angler: Angler
 
+    __slots__ = ("_angler", "_angler_data", "angler_id", "name")
+
     def __init__(self, data: DataTypeAliases, angler: Angler, moogle: Moogle) -> None:
         """Generic object for bridging FF14Angler and Moogle.
 
@@ -2059,11 +2597,12 @@ class ItemFish(Object):
 
         """
         self._angler = angler
+        self._angler_data = None
         super().__init__(data=data, moogle=moogle)
 
         item_id = data.get("item")
         if self._moogle._angler_fish_map is not None and item_id is not None:
-            name = self._moogle._items_ref.get(str(item_id), None)
+            name = self._moogle._items_ref.get(item_id, None)
             if name is None or isinstance(name, int):
                 self.angler_id = None
                 self.name = None
@@ -2114,8 +2653,11 @@ class ItemFish(Object):
         chance = 0
         best: Optional[AnglerFish] = None
         LOGGER.debug("Checking Best Chance: %s | Type: %s | Entries: %s", best_chance, type(self), len(data))
-        for entry in fish_locs:
-            res: Optional[FishingData] = await self._angler.get_location_fish_data(location_id=entry, fish_id=fish_id)
+        # Each location is a separate page, so we fetch them concurrently rather than one at a time.
+        results: list[Optional[FishingData]] = await asyncio.gather(
+            *(self._angler.get_location_fish_data(location_id=entry, fish_id=fish_id) for entry in fish_locs),
+        )
+        for entry, res in zip(fish_locs, results, strict=True):
             if res is None:
                 continue
 
@@ -2142,17 +2684,14 @@ class ItemFish(Object):
     @property
     def angler_data(self) -> Optional[list[AnglerFish]]:
         """Houses the FF14Angler information retrieved from `<ItemFish.get_ff14angler_data>`."""
-        try:
-            return self._angler_data
-        except AttributeError:
-            return None
+        return self._angler_data
 
     @property
     def angler_url(self) -> str:
         """The FF14Angler website url for the Fish."""
         if self.angler_id is None:
-            return "https://en.ff14angler.com/"
-        return f"https://en.ff14angler.com/fish/{self.angler_id}"
+            return ANGLER_BASE_URL
+        return ANGLER_FISH_URL + str(self.angler_id)
 
 
 class Fishing(ItemFish):
@@ -2193,6 +2732,8 @@ class Fishing(ItemFish):
     is_hidden: bool
     fishing_spot: FishingSpot
 
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = ("text", "is_hidden", "fishing_spot", "item")
+
     __slots__ = (
         "fishing_spot",
         "is_hidden",
@@ -2215,7 +2756,6 @@ class Fishing(ItemFish):
 
         """
         super().__init__(data=data, angler=angler, moogle=moogle)
-        self._repr_keys = ["text", "is_hidden", "fishing_spot", "item"]
         for key in self.__slots__:
             value: Optional[int | bool | str] = data.get(key, None)
             if value is None:
@@ -2267,6 +2807,8 @@ class SpearFishing(ItemFish):
     territory_type: SpearFishingNotebook
     is_visible: bool
 
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = ("item", "is_visible", "description")
+
     __slots__ = (
         "description",
         "is_visible",
@@ -2288,8 +2830,6 @@ class SpearFishing(ItemFish):
 
         """
         super().__init__(data=data, angler=angler, moogle=moogle)
-
-        self._repr_keys = ["item", "is_visible", "description"]
         for key in self.__slots__:
             value: Optional[int | bool | str] = data.get(key, None)
             if value is None:
@@ -2342,10 +2882,18 @@ class SpearFishingNotebook(Object):
     y: int
     place_name: PlaceName
 
+    # FF14 Angler website lookup information.
+    spot_id: Optional[int]
+    _angler: Angler
+
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = ("place_name", "x", "y", "gathering_level", "is_shadow_node")
+
     __slots__ = (
+        "_angler",
         "gathering_level",
         "is_shadow_node",
         "place_name",
+        "spot_id",
         "x",
         "y",
     )
@@ -2365,7 +2913,6 @@ class SpearFishingNotebook(Object):
         """
         super().__init__(data=data, moogle=moogle)
         self._angler = angler
-        self._repr_keys = ["place_name", "x", "y", "gathering_level", "is_shadow_node"]
         for key in self.__slots__:
             value: Optional[int | bool | str] = data.get(key, None)
             if value is None:
@@ -2391,9 +2938,9 @@ class SpearFishingNotebook(Object):
     @property
     def angler_url(self) -> str:
         if self.spot_id is None:
-            return "https://en.ff14angler.com"
+            return ANGLER_BASE_URL
 
-        return f"https://en.ff14angler.com/spot/{self.spot_id}"
+        return ANGLER_SPOT_URL + str(self.spot_id)
 
 
 class FishingSpot(Object):
@@ -2436,6 +2983,8 @@ class FishingSpot(Object):
 
     Properties
     ----------
+    items: :class:`list[int]`
+        The item ids of every Fish that can be caught in this spot.
     angler_url: :class:`str`
         The FF14Angler website url for the Fish.
 
@@ -2461,7 +3010,17 @@ class FishingSpot(Object):
     # FF14 Angler website lookup information.
     _angler_loc_id: Optional[int]  # This value comes from `Moogle.ff14angler_loc_map` dict.
 
+    _enum_keys: ClassVar[dict[str, type[Enum]]] = {"fishing_spot_category": FishingSpotCategory}
+
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = (
+        "gathering_level",
+        "fishing_spot_category",
+        "place_name",
+        *(f"item{idx}" for idx in range(10)),
+    )
+
     __slots__ = (
+        "_angler_loc_id",
         "fishing_spot_category",
         "gathering_level",
         "item0",
@@ -2493,41 +3052,42 @@ class FishingSpot(Object):
 
         """
         super().__init__(data=data, moogle=kwargs["moogle"])
-        self._repr_keys = [
-            "gathering_level",
-            "fishing_spot_category",
-            "place_name",
-        ]
-        self._repr_keys.extend([f"item{idx}" for idx in range(10)])
         for key in self.__slots__:
-            value: Optional[int | bool | str] = data.get(key, None)
+            value: Optional[int | bool | str | Enum] = data.get(key, None)
             if value is None:
                 continue
+            # The `item0` to `item9` ids are kept as is, see `<FishingSpot.items>`.
             if isinstance(value, int):
-                if key.startswith("item") and value != 0:
-                    setattr(self, key, value)
-
-                elif key.lower() == "place_name" and value != 0:
+                if key == "place_name" and value != 0:
                     self.place_name = self._moogle._get_place_name(place_id=value)
 
                     if self._moogle._angler_loc_map is not None:
                         self._angler_loc_id = self._moogle._angler_loc_map.get(self.place_name.name)
+                    continue
 
-                elif key.lower() == "fishing_spot_category":
-                    self.fishing_spot_category = FishingSpotCategory(value)
-
+                if key in self._enum_keys:
+                    value = self._to_enum(key, value)
                 elif key == "rare":
-                    self.rare = bool(value)
-                else:
-                    setattr(self, key, value)
-            else:
-                setattr(self, key, value)
+                    value = bool(value)
+            setattr(self, key, value)
+
+    @property
+    def items(self) -> list[int]:
+        """The Final Fantasy 14 item ids of every Fish that can be caught in this spot, unused item slots are skipped.
+
+        Returns
+        -------
+        :class:`list[int]`
+            The `item0` to `item9` ids in order.
+
+        """
+        return [item_id for key in _FISHING_SPOT_ITEM_KEYS if (item_id := getattr(self, key, 0)) != 0]
 
     @property
     def angler_url(self) -> str:
         if self._angler_loc_id is None:
-            return "https://en.ff14angler.com"
-        return f"https://en.ff14angler.com/spot/{self._angler_loc_id}"
+            return ANGLER_BASE_URL
+        return ANGLER_SPOT_URL + str(self._angler_loc_id)
 
 
 class GatheringItem(Object):
@@ -2549,6 +3109,8 @@ class GatheringItem(Object):
     quest: bool
     is_hidden: bool
 
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = ("quest", "is_hidden", "gathering_item_level")
+
     __slots__ = (
         "gathering_item_level",
         "is_hidden",
@@ -2568,15 +3130,18 @@ class GatheringItem(Object):
 
         """
         super().__init__(data=data, moogle=kwargs["moogle"])
-        self._repr_keys = ["quest", "is_hidden", "gathering_item_level"]
-        for key in self.__slots__:
-            value: Optional[int | bool | str] = data.get(key, None)
-            if value is None:
-                continue
-            if key == "gathering_item_level" and isinstance(value, int):
-                self.gathering_item_level = self._moogle._get_gathering_level(level_id=value)
-            elif key in ["is_hidden", "quest"] and isinstance(value, int):
-                setattr(self, key, bool(value))
+        # Only three fields, so we assign them directly rather than walking our slots.
+        # Empty cells are `None` and short rows are missing the key entirely, either way the attribute is left unset.
+        # `<GatheringItemData>` can't express that, hence the `isinstance` checks pyright considers unnecessary.
+        level: Optional[int] = data.get("gathering_item_level", None)
+        if isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            self.gathering_item_level = self._moogle._get_gathering_level(level_id=level)
+        is_hidden: Optional[int | bool] = data.get("is_hidden", None)
+        if isinstance(is_hidden, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            self.is_hidden = bool(is_hidden)
+        quest: Optional[int | bool] = data.get("quest", None)
+        if isinstance(quest, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            self.quest = bool(quest)
 
 
 class GatheringItemLevel(Object):
@@ -2594,6 +3159,8 @@ class GatheringItemLevel(Object):
     gathering_item_level: int
     stars: int
 
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = ("gathering_item_level", "stars")
+
     __slots__ = ("gathering_item_level", "stars")
 
     def __init__(self, data: GatheringItemLevelData, **kwargs: Unpack[ObjectParams]) -> None:
@@ -2609,12 +3176,8 @@ class GatheringItemLevel(Object):
 
         """
         super().__init__(data=data, moogle=kwargs["moogle"])
-        self._repr_keys = ["gathering_item_level", "stars"]
-        for key in self.__slots__:
-            value: Optional[int | bool | str] = data.get(key, None)
-            if value is None:
-                continue
-            setattr(self, key, value)
+        self.gathering_item_level = data.get("gathering_item_level", None)
+        self.stars = data.get("stars", None)
 
 
 class PlaceName(Object):
@@ -2629,6 +3192,8 @@ class PlaceName(Object):
 
     name: str
 
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = ("name",)
+
     __slots__ = ("name",)
 
     def __init__(self, data: PlaceNameData, **kwargs: Unpack[ObjectParams]) -> None:
@@ -2644,7 +3209,6 @@ class PlaceName(Object):
 
         """
         super().__init__(data=data, moogle=kwargs["moogle"])
-        self._repr_keys = ["name"]
         self.name = data.get("name", None)
 
 
@@ -2675,6 +3239,8 @@ class InventoryItem(Object):
     source: str
     location: InventoryLocation
 
+    _repr_keys: ClassVar[Optional[tuple[str, ...]]] = ("name", "id", "location", "quantity", "source")
+
     __slots__ = (
         "id",
         "location",
@@ -2696,24 +3262,21 @@ class InventoryItem(Object):
 
         """
         self.id = item_id
-        self._repr_keys = ["name", "id", "location", "quantity", "source"]
-        for key in self.__slots__:
-            value: Optional[int | bool | str] = data.get(key, None)
-            if value is None:
-                continue
-            if key.lower() == "type":
-                if isinstance(value, str) and value.lower() == "nq":
-                    self.quality = ItemQuality.NQ
-                elif isinstance(value, str) and value.lower() == "hq":
-                    self.quality = ItemQuality.HQ
-            elif key.lower().startswith("total_quantity") and isinstance(value, int):
+        # The CSV column names don't line up with our attribute names, so we walk the data rather than our slots.
+        for key, value in data.items():
+            if key == "type" and isinstance(value, str):
+                quality: Optional[ItemQuality] = _ATOOLS_ITEM_QUALITY.get(value.lower())
+                if quality is not None:
+                    self.quality = quality
+            elif key == "total_quantity_available" and isinstance(value, int):
                 self.quantity = value
-            elif key.lower() == "inventory_location" and isinstance(value, str):
+            elif key == "inventory_location" and isinstance(value, str):
                 self.location = self._convert_inv_loc_to_enum(location=value)
-            else:
+            elif key in self.__slots__:
                 setattr(self, key, value)
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _convert_inv_loc_to_enum(location: str) -> InventoryLocation:
         """Convert a provided location string from the Allagon Tools CSV into a :class:`InventoryLocationEnum`.
 
@@ -2728,28 +3291,17 @@ class InventoryItem(Object):
             The converted inventory location as an Enum.
 
         """
-        if location.lower().startswith("bag"):
-            return InventoryLocation.bag
-        if location.lower().startswith("glamour"):
-            return InventoryLocation.armoire
-        if location.lower().startswith("saddlebag"):
-            if location.lower().startswith("premium"):
-                if "left" in location.lower():
-                    return InventoryLocation.premium_saddlebag_left
-                return InventoryLocation.premium_saddlebag_right
-            if "left" in location.lower():
+        # Every row of a CSV shares a handful of location strings, hence the cache.
+        location = location.lower()
+        if location.startswith("saddlebag"):
+            if "left" in location:
                 return InventoryLocation.saddlebag_left
             return InventoryLocation.saddlebag_right
-        if location.lower().startswith("armory"):
-            return InventoryLocation.armory
-        if location.lower().startswith("market"):
-            return InventoryLocation.market
-        if location.lower().startswith("free"):
-            return InventoryLocation.free_company
-        if location.lower().startswith("currency"):
-            return InventoryLocation.currency
-        if location.lower().startswith("equipped"):
-            return InventoryLocation.equipped_gear
-        if location.lower().startswith("crystals"):
-            return InventoryLocation.crystals
+        if location.startswith("premium"):
+            if "left" in location:
+                return InventoryLocation.premium_saddlebag_left
+            return InventoryLocation.premium_saddlebag_right
+        for prefix, inv_loc in _ATOOLS_INV_LOC_PREFIXES:
+            if location.startswith(prefix):
+                return inv_loc
         return InventoryLocation.null
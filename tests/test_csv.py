@@ -0,0 +1,41 @@
+"""Copyright (C) 2021-2025 Katelynn Cadwallader.
+
+This file is part of Moogle's Intuition.
+
+Moogle's Intuition is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 3, or (at your option)
+any later version.
+
+Moogle's Intuition is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public
+License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Moogle's Intuition; see the file COPYING.  If not, write to the Free
+Software Foundation, 51 Franklin Street - Fifth Floor, Boston, MA
+02110-1301, USA.
+"""
+
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from moogle_intuition.modules import Builder
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# The XIV Datamining layout, an index line, the keys, the types and the unused "0" row before the data.
+_CSV: str = 'key,0,1\n#,Name,Level\nint32,str,byte\n0,"",0\n1,"Copper Ore",5\n2,"Iron Ore",10\n\n'
+
+
+def test_csv_parse_skips_blank_lines(tmp_path: Path) -> None:
+    """A trailing blank line must be skipped, like `csv.DictReader` did, rather than failing the whole file."""
+    path = tmp_path.joinpath("Item.csv")
+    path.write_text(_CSV, encoding="utf-8")
+    data, keys, _ = Builder().csv_parse(path=path)
+    assert keys == ["#", "name", "level"]
+    assert data == {"1": {"id": 1, "name": "Copper Ore", "level": 5}, "2": {"id": 2, "name": "Iron Ore", "level": 10}}
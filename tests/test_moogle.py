@@ -0,0 +1,41 @@
+"""Copyright (C) 2021-2025 Katelynn Cadwallader.
+
+This file is part of Moogle's Intuition.
+
+Moogle's Intuition is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 3, or (at your option)
+any later version.
+
+Moogle's Intuition is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public
+License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Moogle's Intuition; see the file COPYING.  If not, write to the Free
+Software Foundation, 51 Franklin Street - Fifth Floor, Boston, MA
+02110-1301, USA.
+"""
+
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from moogle_intuition.modules import Moogle
+
+# Item id 10 is listed by both row 1 and row 3.
+_TABLE: dict[int, dict[str, Any]] = {1: {"item": 10}, 2: {"item": 20}, 3: {"item": 10}, 4: {"item": None}}
+
+
+@pytest.mark.parametrize(
+    ("flip_key_value", "expected"),
+    [(True, {10: 3, 20: 2}), (False, {1: 10, 2: 20, 3: 10})],
+)
+def test_reference_dict(flip_key_value: bool, expected: dict[int, int]) -> None:  # noqa: FBT001
+    """Rows without a value are skipped, when flipped the last row wins for a duplicate value."""
+    moogle = Moogle.__new__(Moogle)
+    assert moogle._reference_dict(data=_TABLE, value_get="item", flip_key_value=flip_key_value) == expected
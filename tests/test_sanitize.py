@@ -0,0 +1,56 @@
+"""Copyright (C) 2021-2025 Katelynn Cadwallader.
+
+This file is part of Moogle's Intuition.
+
+Moogle's Intuition is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 3, or (at your option)
+any later version.
+
+Moogle's Intuition is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public
+License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Moogle's Intuition; see the file COPYING.  If not, write to the Free
+Software Foundation, 51 Franklin Street - Fifth Floor, Boston, MA
+02110-1301, USA.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from moogle_intuition.modules import Builder
+
+
+@pytest.mark.parametrize(
+    ("key_name", "expected"),
+    [
+        ("Item[0][1]", "Item0_1"),
+        ("Cost{Gil}", "CostGil"),
+        ("Level:Item", "LevelItem"),
+        ("(Param)", "Param"),
+        ("<ms>Speed<s>", "Speed"),
+        ("<%>", "_percent"),
+        ("Bonus%", "Bonus_percent"),
+        ("Maker's Mark", "Makers_Mark"),
+        ("Can-Be–HQ", "Can_Be_HQ"),
+        ("12Item", "onetwoItem"),
+        ("1", "1"),
+        ("Name", "Name"),
+    ],
+)
+def test_sanitize_key_name(key_name: str, expected: str) -> None:
+    """Each `SANITIZED_KEYS` entry is replaced, and a leading digit is spelled out."""
+    assert Builder.sanitize_key_name(key_name) == expected
+
+
+@pytest.mark.parametrize(
+    ("key_name", "expected"),
+    [("]}[", "_"), ("]([", "_"), ("<%(>", "_percent"), ("]:[", "_")],
+)
+def test_sanitize_key_name_order(key_name: str, expected: str) -> None:
+    """Overlapping keys are replaced in the order `SANITIZED_KEYS` lists them."""
+    assert Builder.sanitize_key_name(key_name) == expected